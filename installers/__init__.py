@@ -2,51 +2,147 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """Installers for various tools and packages."""
 
-from .bootstrap import BootstrapInstaller
-from .github_cli import GitHubCLIInstaller
-from .uv import UVInstaller
-from .nodejs import NodeJSInstaller
-from .pnpm import PNPMInstaller
-from .neovim import NeovimInstaller
-from .btop import BTopInstaller
-from .nginx import NginxInstaller
-from .certbot import CertbotInstaller
-from .ufw import UFWInstaller
-from .fail2ban import Fail2banInstaller
-from .image_viewer import ImageViewerInstaller
-from .curlpad import CurlpadInstaller
-from .dev_tools import DevToolsInstaller
-from .ssh_key import SSHKeyInstaller
-from .fastfetch import FastfetchInstaller
-from .podman import PodmanInstaller
-from .zsh import ZshInstaller
-from .git import GitInstaller
-from .rkhunter import RkhunterInstaller
-from .chkrootkit import ChkrootkitInstaller
-from .vrms import VRMSInstaller
+import importlib
+
+from utils.types import InstallerSpec
+
+# Registry of every installer, in prompt order. Bootstrap must stay first.
+# Plain apt tools use AptInstaller and are described entirely by their spec.
+# check_binary and apt_packages also tell the result cache what to watch.
+INSTALLER_META: tuple[InstallerSpec, ...] = (
+    InstallerSpec(
+        "bootstrap", "Bootstrap", "Initialize system with essential packages",
+        "bootstrap", "BootstrapInstaller"
+    ),
+    InstallerSpec(
+        "github_cli", "GitHub CLI", "Install GitHub CLI (gh)",
+        "github_cli", "GitHubCLIInstaller",
+        check_binary=("gh",), apt_packages=("gh",)
+    ),
+    InstallerSpec(
+        "uv", "uv", "Install uv (Astral Python manager)",
+        "uv", "UVInstaller",
+        check_binary=("uv",)
+    ),
+    InstallerSpec(
+        "nodejs", "Node.js", "Install Node.js via nvm",
+        "nodejs", "NodeJSInstaller"
+    ),
+    InstallerSpec(
+        "pnpm", "pnpm", "Enable pnpm via corepack",
+        "pnpm", "PNPMInstaller",
+        check_binary=("pnpm",)
+    ),
+    InstallerSpec(
+        "neovim", "Neovim", "Install Neovim (latest release)",
+        "neovim", "NeovimInstaller",
+        check_binary=("nvim",)
+    ),
+    InstallerSpec(
+        "btop", "btop", "Install btop system monitor",
+        "apt", "AptInstaller",
+        check_binary=("btop",), apt_packages=("btop",)
+    ),
+    InstallerSpec(
+        "nginx", "nginx", "Install nginx web server",
+        "nginx", "NginxInstaller",
+        check_binary=("nginx",), apt_packages=("nginx",)
+    ),
+    InstallerSpec(
+        "certbot", "Certbot", "Install Certbot (Let's Encrypt)",
+        "certbot", "CertbotInstaller",
+        check_binary=("certbot",)
+    ),
+    InstallerSpec(
+        "ufw", "UFW", "Install and configure UFW firewall",
+        "ufw", "UFWInstaller",
+        check_binary=("ufw",), apt_packages=("ufw",)
+    ),
+    InstallerSpec(
+        "fail2ban", "Fail2ban", "Install and configure Fail2ban",
+        "fail2ban", "Fail2banInstaller",
+        check_binary=("fail2ban-client",), apt_packages=("fail2ban",)
+    ),
+    InstallerSpec(
+        "image_viewer", "Image Viewer", "Install Advance Image Viewer",
+        "image_viewer", "ImageViewerInstaller",
+        check_binary=("aiv", "advance-image-viewer")
+    ),
+    InstallerSpec(
+        "curlpad", "curlpad", "Install curlpad",
+        "curlpad", "CurlpadInstaller",
+        check_binary=("curlpad",)
+    ),
+    InstallerSpec(
+        "dev_tools", "Developer Tools",
+        "Install developer tools (openssl, clangd, build-essential, etc.)",
+        "apt", "AptInstaller",
+        check_binary=("gcc", "make", "cmake", "pkg-config"),
+        apt_packages=("openssl", "clangd", "build-essential", "pkg-config", "cmake", "git")
+    ),
+    InstallerSpec(
+        "ssh_key", "SSH Key", "Generate SSH key pair (Ed25519) and display public key",
+        "ssh_key", "SSHKeyInstaller"
+    ),
+    InstallerSpec(
+        "fastfetch", "fastfetch", "Install fastfetch system information tool",
+        "apt", "AptInstaller",
+        check_binary=("fastfetch",), apt_packages=("fastfetch",)
+    ),
+    InstallerSpec(
+        "podman", "podman", "Install podman container engine",
+        "apt", "AptInstaller",
+        check_binary=("podman",), apt_packages=("podman",)
+    ),
+    InstallerSpec(
+        "zsh", "zsh", "Install zsh and set it as default shell",
+        "zsh", "ZshInstaller",
+        check_binary=("zsh",), apt_packages=("zsh",)
+    ),
+    InstallerSpec(
+        "git", "git", "Install git version control system",
+        "apt", "AptInstaller",
+        check_binary=("git",), apt_packages=("git",)
+    ),
+    InstallerSpec(
+        "rkhunter", "rkhunter", "Install rkhunter (Rootkit Hunter) security scanner",
+        "apt", "AptInstaller",
+        check_binary=("rkhunter",), apt_packages=("rkhunter",)
+    ),
+    InstallerSpec(
+        "chkrootkit", "chkrootkit", "Install chkrootkit security scanner",
+        "apt", "AptInstaller",
+        check_binary=("chkrootkit",), apt_packages=("chkrootkit",)
+    ),
+    InstallerSpec(
+        "vrms", "vrms", "Install vrms (Virtual Richard M. Stallman - lists non-free packages)",
+        "apt", "AptInstaller",
+        check_binary=("vrms",), apt_packages=("vrms",)
+    ),
+)
+
+# Installer class name -> submodule, imported on first attribute access (PEP 562)
+_LAZY = {spec.class_name: spec.module for spec in INSTALLER_META}
 
 __all__ = [
-    "BootstrapInstaller",
-    "GitHubCLIInstaller",
-    "UVInstaller",
-    "NodeJSInstaller",
-    "PNPMInstaller",
-    "NeovimInstaller",
-    "BTopInstaller",
-    "NginxInstaller",
-    "CertbotInstaller",
-    "UFWInstaller",
-    "Fail2banInstaller",
-    "ImageViewerInstaller",
-    "CurlpadInstaller",
-    "DevToolsInstaller",
-    "SSHKeyInstaller",
-    "FastfetchInstaller",
-    "PodmanInstaller",
-    "ZshInstaller",
-    "GitInstaller",
-    "RkhunterInstaller",
-    "ChkrootkitInstaller",
-    "VRMSInstaller",
-]
+    "INSTALLER_META",
+    "load_installer",
+] + sorted(_LAZY)
+
+
+def load_installer(spec: InstallerSpec) -> type:
+    """Import and return the installer class for a spec."""
+    module = importlib.import_module(f".{spec.module}", __name__)
+    return getattr(module, spec.class_name)
+
+
+def __getattr__(name: str):
+    """Import installer submodules lazily."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    return getattr(module, name)
+
 
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
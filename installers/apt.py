@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: Copyright (C) 2025 Akshat Kotpalliwar (alias IntegerAlex) <inquiry.akshatkotpalliwar@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+"""Generic installer for tools that are plain apt packages."""
+
+from utils.base import BaseInstaller, cache_installed
+from utils.types import InstallerResult
+
+
+class AptInstaller(BaseInstaller):
+    """Install the apt packages listed in the installer spec."""
+    
+    @cache_installed
+    def is_installed(self) -> bool:
+        try:
+            return self.is_package_installed(list(self.spec.apt_packages))
+        except Exception:
+            # dpkg isn't available, fall back to looking for the binaries
+            return all(self.is_binary_installed(binary) for binary in self.spec.check_binary)
+    
+    def install(self) -> InstallerResult:
+        try:
+            self.console.print(f"[blue]ℹ[/blue] Installing {self.spec.title}")
+            
+            self.queue_apt(list(self.spec.apt_packages))
+            
+            return InstallerResult(True, f"{self.spec.title} installed successfully")
+        except Exception as e:
+            return InstallerResult(False, f"Failed to install {self.spec.title}", str(e))
@@ -14,12 +14,9 @@ class BootstrapInstaller(BaseInstaller):
         try:
             print("ℹ Initializing system")
 
-            self.runner.run(["apt", "update"], sudo=True, description="Updating package lists")
-            self.runner.run(
-                ["apt", "install", "-y", "ca-certificates", "curl", "wget", "gnupg", "lsb-release", "lsof"],
-                sudo=True,
-                description="Installing essential packages"
-            )
+            # Essential packages are needed by the other installers, so flush now
+            self.queue_apt(["ca-certificates", "curl", "wget", "gnupg", "lsb-release", "lsof"])
+            self.flush_apt(self.runner)
 
             return InstallerResult(True, "System initialized successfully")
         except PackageManagerError:
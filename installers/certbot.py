@@ -2,72 +2,136 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """Certbot installer."""
 
+import json
 import os
-import shutil
+import time
 
-from utils.base import BaseInstaller
+from utils.base import BaseInstaller, cache_installed
 from utils.types import InstallerResult
 
+# Persistent wheel cache so re-installs don't download certbot again
+PIP_CACHE_DIR = "/var/cache/rig/pip"
+GET_PIP_URL = "https://bootstrap.pypa.io/get-pip.py"
+
+# Snapshot of a populated venv, restored instead of running pip again
+SNAPSHOT_PATH = "/var/cache/rig/certbot-venv.tar.gz"
+SNAPSHOT_MANIFEST = "/var/cache/rig/certbot-venv.json"
+SNAPSHOT_MAX_AGE = 30 * 24 * 60 * 60
+
 
 class CertbotInstaller(BaseInstaller):
     """Install Certbot (Let's Encrypt)."""
     
+    # Building the venv is the slowest post-apt step and only needs the network
+    PARALLEL_POST_APT = True
+    
+    @cache_installed
     def is_installed(self) -> bool:
-        # Check if command exists first to avoid error logs
-        if not shutil.which("certbot"):
-            return False
-        
-        try:
-            result = self.runner.run(["certbot", "--version"], check=False, capture_output=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        return self.is_binary_installed("certbot")
     
     def install(self) -> InstallerResult:
         try:
             self.console.print("[blue]ℹ[/blue] Installing Certbot")
             
-            # Install dependencies
-            self.runner.run(
-                ["apt", "install", "-y", "python3", "python3-dev", "python3-venv", 
-                 "libaugeas-dev", "gcc"],
-                sudo=True,
-                description="Installing Certbot dependencies"
-            )
+            # Queue dependencies, the venv is built once they are installed
+            self.queue_apt(["python3", "python3-dev", "python3-venv", "libaugeas-dev", "gcc"])
             
-            # Create certbot directory
-            self.runner.run(["mkdir", "-p", "/opt/certbot"], sudo=True)
+            return InstallerResult(True, "Certbot installed successfully")
+        except Exception as e:
+            return InstallerResult(False, "Failed to install Certbot", str(e))
+    
+    def post_apt(self) -> InstallerResult:
+        try:
+            # Create certbot and pip cache directories
+            self.runner.run(["mkdir", "-p", "/opt/certbot", PIP_CACHE_DIR], sudo=True)
             
-            # Create virtual environment if it doesn't exist
-            certbot_venv = "/opt/certbot/bin/python"
-            if not os.path.exists(certbot_venv):
+            python_version = self._system_python_version()
+            if not self._restore_snapshot(python_version):
+                # Create the virtual environment, skipping the slow ensurepip bootstrap.
+                # venv reuses an existing directory, so no existence check is needed
                 self.runner.run(
-                    ["python3", "-m", "venv", "/opt/certbot"],
+                    ["python3", "-m", "venv", "--without-pip", "/opt/certbot"],
                     sudo=True,
                     description="Creating Certbot virtual environment"
                 )
+                
+                # get-pip.py installs pip and certbot in a single pip invocation
+                pip_args = f"--cache-dir {PIP_CACHE_DIR} --prefer-binary certbot certbot-nginx"
+                self.runner.run(
+                    ["bash", "-c",
+                     f"set -o pipefail; curl -fsSL {GET_PIP_URL} | sudo /opt/certbot/bin/python - {pip_args}"],
+                    description="Installing Certbot"
+                )
+                
+                self._save_snapshot(python_version)
             
-            # Install certbot
-            self.runner.run(
-                ["/opt/certbot/bin/pip", "install", "--upgrade", "pip"],
+            # Hardlink saves the symlink lookup on every certbot call, but
+            # only works when /opt and /usr are on the same filesystem
+            result = self.runner.run(
+                ["ln", "-f", "/opt/certbot/bin/certbot", "/usr/bin/certbot"],
                 sudo=True,
-                description="Upgrading pip"
+                check=False,
+                capture_output=True,
+                description="Linking certbot"
             )
+            if result.returncode != 0:
+                self.runner.run(
+                    ["ln", "-sf", "/opt/certbot/bin/certbot", "/usr/bin/certbot"],
+                    sudo=True,
+                    description="Creating certbot symlink"
+                )
             
-            self.runner.run(
-                ["/opt/certbot/bin/pip", "install", "certbot", "certbot-nginx"],
-                sudo=True,
-                description="Installing Certbot"
+            return InstallerResult(True, "Certbot installed successfully")
+        except Exception as e:
+            return InstallerResult(False, "Failed to install Certbot", str(e))
+    
+    def _system_python_version(self) -> str:
+        """Return the major.minor version of the python3 used for the venv."""
+        result = self.runner.run(
+            ["python3", "-c", "import sys; print('%d.%d' % sys.version_info[:2])"],
+            capture_output=True
+        )
+        return result.stdout.strip()
+    
+    def _restore_snapshot(self, python_version: str) -> bool:
+        """Restore the cached venv if it is recent and built for this Python."""
+        try:
+            if time.time() - os.stat(SNAPSHOT_PATH).st_mtime > SNAPSHOT_MAX_AGE:
+                return False
+            with open(SNAPSHOT_MANIFEST) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        if manifest.get("python") != python_version:
+            return False
+        
+        self.runner.run(
+            ["tar", "-xzf", SNAPSHOT_PATH, "-C", "/opt"],
+            sudo=True,
+            description="Restoring cached Certbot environment"
+        )
+        return True
+    
+    def _save_snapshot(self, python_version: str):
+        """Snapshot the populated venv for later re-installs."""
+        try:
+            result = self.runner.run(
+                ["/opt/certbot/bin/certbot", "--version"],
+                check=False,
+                capture_output=True
             )
+            manifest = {
+                "python": python_version,
+                "certbot": result.stdout.strip().split()[-1] if result.stdout else None,
+            }
             
-            # Create symlink
             self.runner.run(
-                ["ln", "-sf", "/opt/certbot/bin/certbot", "/usr/bin/certbot"],
+                ["tar", "-czf", SNAPSHOT_PATH, "-C", "/opt", "certbot"],
                 sudo=True,
-                description="Creating certbot symlink"
+                description="Caching Certbot environment"
             )
-            
-            return InstallerResult(True, "Certbot installed successfully")
+            self.runner.write_file_sudo(SNAPSHOT_MANIFEST, json.dumps(manifest))
         except Exception as e:
-            return InstallerResult(False, "Failed to install Certbot", str(e))
-
+            # The snapshot only speeds up re-installs, don't fail because of it
+            self.logger.log("warning", f"Could not cache Certbot environment: {e}")
@@ -2,25 +2,18 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """curlpad installer."""
 
-import shutil
-
-from utils.base import BaseInstaller
+from utils.base import BaseInstaller, cache_installed
 from utils.types import InstallerResult
 
 
 class CurlpadInstaller(BaseInstaller):
     """Install curlpad."""
     
+    PARALLELIZABLE = True
+    
+    @cache_installed
     def is_installed(self) -> bool:
-        # Check if command exists first to avoid error logs
-        if not shutil.which("curlpad"):
-            return False
-        
-        try:
-            result = self.runner.run(["curlpad", "--version"], check=False, capture_output=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        return self.is_binary_installed("curlpad")
     
     def install(self) -> InstallerResult:
         try:
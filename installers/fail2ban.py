@@ -2,36 +2,16 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """Fail2ban installer."""
 
-import shutil
-
-from utils.base import BaseInstaller
 from utils.types import InstallerResult
 
+from .apt import AptInstaller
+
 
-class Fail2banInstaller(BaseInstaller):
+class Fail2banInstaller(AptInstaller):
     """Install and configure Fail2ban."""
     
-    def is_installed(self) -> bool:
-        # Check if command exists first to avoid error logs
-        if not shutil.which("fail2ban-client"):
-            return False
-        
-        try:
-            result = self.runner.run(["fail2ban-client", "--version"], check=False, capture_output=True)
-            return result.returncode == 0
-        except Exception:
-            return False
-    
-    def install(self) -> InstallerResult:
+    def post_apt(self) -> InstallerResult:
         try:
-            self.console.print("[blue]ℹ[/blue] Installing Fail2ban")
-            
-            self.runner.run(
-                ["apt", "install", "-y", "fail2ban"],
-                sudo=True,
-                description="Installing Fail2ban"
-            )
-            
             # Create jail.local configuration
             jail_config = """[DEFAULT]
 bantime = 1h
@@ -45,8 +25,9 @@ port = ssh
 logpath = %(sshd_log)s
 """
             
-            self.runner.run(
-                ["bash", "-c", f"echo '{jail_config}' | sudo tee /etc/fail2ban/jail.local >/dev/null"],
+            self.runner.write_file_sudo(
+                "/etc/fail2ban/jail.local",
+                jail_config,
                 description="Configuring Fail2ban"
             )
             
@@ -2,56 +2,73 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """GitHub CLI installer."""
 
-import subprocess
+import os
+import platform
+import tempfile
 
-from utils.base import BaseInstaller
+from utils.base import BaseInstaller, cache_installed
 from utils.types import InstallerResult
 
+KEYRING_URL = "https://cli.github.com/packages/githubcli-archive-keyring.gpg"
+KEYRING_PATH = "/etc/apt/keyrings/githubcli-archive-keyring.gpg"
+SOURCES_LIST = "/etc/apt/sources.list.d/github-cli.list"
+
+# platform.machine() names mapped to dpkg architectures
+_DEB_ARCH = {"x86_64": "amd64", "aarch64": "arm64", "armv7l": "armhf", "i686": "i386"}
+
 
 class GitHubCLIInstaller(BaseInstaller):
     """Install GitHub CLI."""
     
+    PARALLELIZABLE = True
+    
+    @cache_installed
     def is_installed(self) -> bool:
         try:
-            result = self.runner.run(["gh", "--version"], check=False, capture_output=True)
-            return result.returncode == 0
-        except:
-            return False
+            # gh installed outside apt, e.g. from a release tarball, counts too
+            return self.is_package_installed(["gh"]) or self.is_binary_installed("gh")
+        except Exception:
+            # dpkg isn't available, only the PATH index can tell
+            return self.is_binary_installed("gh")
     
     def install(self) -> InstallerResult:
         try:
             self.console.print("[blue]ℹ[/blue] Installing GitHub CLI")
             
-            # Create keyrings directory
-            self.runner.run(["mkdir", "-p", "/etc/apt/keyrings"], sudo=True)
+            self._download_keyring()
+            self._add_repository(_DEB_ARCH.get(platform.machine(), "amd64"))
             
-            # Download and install keyring
-            keyring_url = "https://cli.github.com/packages/githubcli-archive-keyring.gpg"
+            # gh itself is installed with the shared apt transaction
+            self.queue_apt(["gh"])
+            
+            return InstallerResult(True, "GitHub CLI installed successfully")
+        except Exception as e:
+            return InstallerResult(False, "Failed to install GitHub CLI", str(e))
+    
+    def _download_keyring(self):
+        """Download the GitHub CLI archive keyring into place."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_keyring = os.path.join(tmp_dir, os.path.basename(KEYRING_PATH))
             self.runner.run(
-                ["bash", "-c", f"wget -qO- {keyring_url} | sudo tee /etc/apt/keyrings/githubcli-archive-keyring.gpg >/dev/null"],
+                ["curl", "-fsSL", KEYRING_URL, "-o", tmp_keyring],
                 description="Downloading GitHub CLI keyring"
             )
             
+            # install creates /etc/apt/keyrings and sets ownership and mode in one step
             self.runner.run(
-                ["chmod", "go+r", "/etc/apt/keyrings/githubcli-archive-keyring.gpg"],
+                ["install", "-D", "-m", "0644", "-o", "root", "-g", "root", tmp_keyring, KEYRING_PATH],
                 sudo=True
             )
-            
-            # Add repository
-            arch = subprocess.check_output(["dpkg", "--print-architecture"], text=True).strip()
-            repo_line = (
-                f"deb [arch={arch} signed-by=/etc/apt/keyrings/githubcli-archive-keyring.gpg] "
-                f"https://cli.github.com/packages stable main"
-            )
-            self.runner.run(
-                ["bash", "-c", f"echo '{repo_line}' | sudo tee /etc/apt/sources.list.d/github-cli.list >/dev/null"],
-                description="Adding GitHub CLI repository"
-            )
-            
-            self.runner.run(["apt", "update"], sudo=True)
-            self.runner.run(["apt", "install", "-y", "gh"], sudo=True, description="Installing GitHub CLI")
-            
-            return InstallerResult(True, "GitHub CLI installed successfully")
-        except Exception as e:
-            return InstallerResult(False, "Failed to install GitHub CLI", str(e))
-
+    
+    def _add_repository(self, arch: str):
+        """Add the GitHub CLI apt repository."""
+        repo_line = (
+            f"deb [arch={arch} signed-by={KEYRING_PATH}] "
+            f"https://cli.github.com/packages stable main\n"
+        )
+        self.runner.write_file_sudo(
+            SOURCES_LIST,
+            repo_line,
+            description="Adding GitHub CLI repository"
+        )
+        self.add_apt_source(SOURCES_LIST)
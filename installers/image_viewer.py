@@ -2,25 +2,19 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """Advance Image Viewer installer."""
 
-import shutil
-
-from utils.base import BaseInstaller
+from utils.base import BaseInstaller, cache_installed
 from utils.types import InstallerResult
 
 
 class ImageViewerInstaller(BaseInstaller):
     """Install Advance Image Viewer."""
     
+    PARALLELIZABLE = True
+    
+    @cache_installed
     def is_installed(self) -> bool:
         # Check if command exists (common names for advance image viewer)
-        if shutil.which("aiv") or shutil.which("advance-image-viewer"):
-            return True
-        # Check if installed via script location
-        try:
-            result = self.runner.run(["which", "aiv"], check=False, capture_output=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        return self.is_binary_installed("aiv") or self.is_binary_installed("advance-image-viewer")
     
     def install(self) -> InstallerResult:
         try:
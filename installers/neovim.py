@@ -3,63 +3,57 @@
 """Neovim installer."""
 
 import os
-import shutil
-import tempfile
 
-from utils.base import BaseInstaller
+from utils.base import BaseInstaller, cache_installed
 from utils.types import InstallerResult
 
+INSTALL_DIR = "/opt/nvim-linux-x86_64"
+
 
 class NeovimInstaller(BaseInstaller):
     """Install Neovim (latest release)."""
     
+    PARALLELIZABLE = True
+    
+    @cache_installed
     def is_installed(self) -> bool:
-        # Check if command exists first to avoid error logs
-        if not shutil.which("nvim"):
-            return False
-        
-        try:
-            result = self.runner.run(["nvim", "--version"], check=False, capture_output=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        # Answered from the PATH index, without running nvim
+        return self.is_binary_installed("nvim")
     
     def install(self) -> InstallerResult:
         try:
             self.console.print("[blue]ℹ[/blue] Installing Neovim")
             
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".tar.gz") as tmp_file:
-                tmp_path = tmp_file.name
+            download_url = "https://github.com/neovim/neovim/releases/latest/download/nvim-linux-x86_64.tar.gz"
             
+            # Extract next to the old tree and swap it in only once the
+            # download succeeded, so a failed download keeps the old Neovim
+            staging = self.runner.run(
+                ["mktemp", "-d", "/opt/.nvim-XXXXXX"],
+                capture_output=True,
+                sudo=True
+            ).stdout.strip()
+            if not staging.startswith("/opt/"):
+                raise RuntimeError(f"Could not create a staging directory in /opt: {staging}")
             try:
-                download_url = "https://github.com/neovim/neovim/releases/latest/download/nvim-linux-x86_64.tar.gz"
-                self.runner.run(
-                    ["curl", "-L", download_url, "-o", tmp_path],
-                    description="Downloading Neovim"
-                )
-                
-                self.runner.run(
-                    ["rm", "-rf", "/opt/nvim-linux-x86_64"],
-                    sudo=True
-                )
-                
+                # Stream the tarball straight into tar instead of going through a temp file
                 self.runner.run(
-                    ["tar", "-C", "/opt", "-xzf", tmp_path],
-                    sudo=True,
-                    description="Extracting Neovim"
+                    ["bash", "-c", f"set -o pipefail; curl -fsSL {download_url} | sudo tar -C {staging} -xzf -"],
+                    description="Downloading and extracting Neovim"
                 )
                 
-                self.runner.run(
-                    ["ln", "-sf", "/opt/nvim-linux-x86_64/bin/nvim", "/usr/local/bin/nvim"],
-                    sudo=True,
-                    description="Creating symlink"
-                )
-                
-                return InstallerResult(True, "Neovim installed successfully")
+                self.runner.run(["rm", "-rf", INSTALL_DIR], sudo=True)
+                self.runner.run(["mv", f"{staging}/{os.path.basename(INSTALL_DIR)}", INSTALL_DIR], sudo=True)
             finally:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
-                    
+                self.runner.run(["rm", "-rf", staging], check=False, sudo=True)
+            
+            self.runner.run(
+                ["ln", "-sf", f"{INSTALL_DIR}/bin/nvim", "/usr/local/bin/nvim"],
+                sudo=True,
+                description="Creating symlink"
+            )
+            
+            return InstallerResult(True, "Neovim installed successfully")
         except Exception as e:
             return InstallerResult(False, "Failed to install Neovim", str(e))
 
@@ -2,37 +2,17 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """nginx installer."""
 
-import shutil
-
-from utils.base import BaseInstaller
 from utils.types import InstallerResult
 from utils.errors import PackageManagerError, InstallationError
 
+from .apt import AptInstaller
 
-class NginxInstaller(BaseInstaller):
-    """Install nginx."""
-    
-    def is_installed(self) -> bool:
-        # Check if command exists first to avoid error logs
-        if not shutil.which("nginx"):
-            return False
-        
-        try:
-            result = self.runner.run(["nginx", "-v"], check=False, capture_output=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+
+class NginxInstaller(AptInstaller):
+    """Install nginx and enable its service."""
     
-    def install(self) -> InstallerResult:
+    def post_apt(self) -> InstallerResult:
         try:
-            self.console.print("[blue]ℹ[/blue] Installing nginx")
-            
-            self.runner.run(
-                ["apt", "install", "-y", "nginx"],
-                sudo=True,
-                description="Installing nginx"
-            )
-            
             self.runner.run(
                 ["systemctl", "enable", "nginx"],
                 sudo=True,
@@ -54,4 +34,3 @@ class NginxInstaller(BaseInstaller):
                     "Try: sudo apt update && sudo apt install nginx"
                 ]
             ) from e
-
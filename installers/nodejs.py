@@ -4,13 +4,16 @@
 
 from pathlib import Path
 
-from utils.base import BaseInstaller
+from utils.base import BaseInstaller, cache_installed
 from utils.types import InstallerResult
 
 
 class NodeJSInstaller(BaseInstaller):
     """Install Node.js via nvm."""
     
+    PARALLELIZABLE = True
+    
+    @cache_installed
     def is_installed(self) -> bool:
         nvm_dir = Path.home() / ".nvm"
         return (nvm_dir / "nvm.sh").exists()
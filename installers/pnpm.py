@@ -2,25 +2,17 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """pnpm installer."""
 
-import shutil
-
-from utils.base import BaseInstaller
+from utils.base import BaseInstaller, cache_installed
 from utils.types import InstallerResult
 
 
 class PNPMInstaller(BaseInstaller):
     """Enable pnpm via corepack."""
     
+    @cache_installed
     def is_installed(self) -> bool:
-        # Check if command exists first to avoid error logs
-        if not shutil.which("pnpm"):
-            return False
-        
-        try:
-            result = self.runner.run(["pnpm", "--version"], check=False, capture_output=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        # Answered from the PATH index, without running pnpm
+        return self.is_binary_installed("pnpm")
     
     def install(self) -> InstallerResult:
         try:
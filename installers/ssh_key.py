@@ -5,13 +5,18 @@
 import os
 from pathlib import Path
 
-from utils.base import BaseInstaller
+from rich.text import Text
+
+from utils.base import BaseInstaller, cache_installed
 from utils.types import InstallerResult
 
 
 class SSHKeyInstaller(BaseInstaller):
     """Generate SSH key pair."""
     
+    PARALLELIZABLE = True
+    
+    @cache_installed
     def is_installed(self) -> bool:
         """Check if SSH key already exists."""
         ssh_dir = Path.home() / ".ssh"
@@ -29,15 +34,22 @@ class SSHKeyInstaller(BaseInstaller):
             bot_key = ssh_dir / "bot"
             bot_pub = ssh_dir / "bot.pub"
             
-            # Check if key already exists
-            if bot_key.exists() and bot_pub.exists():
+            # Reuse the check made before the prompt
+            if self.is_installed():
                 self.console.print("[yellow]⚠[/yellow] SSH key already exists, skipping generation")
                 self._display_public_key(bot_pub)
-                return InstallerResult(True, "SSH key already exists")
+                return InstallerResult(True, "SSH key already exists", skipped=True)
+            
+            # Ed25519 keys generate almost instantly, RSA 4096 is kept for
+            # servers that don't accept them (RIG_SSH_KEY_TYPE=rsa)
+            if os.environ.get("RIG_SSH_KEY_TYPE", "").lower() == "rsa":
+                key_args = ["-t", "rsa", "-b", "4096"]
+            else:
+                key_args = ["-t", "ed25519"]
             
             # Generate SSH key (non-interactive, quiet mode)
             self.runner.run(
-                ["ssh-keygen", "-t", "rsa", "-b", "4096", "-f", str(bot_key), "-N", "", "-q"],
+                ["ssh-keygen"] + key_args + ["-f", str(bot_key), "-N", "", "-q", "-C", "rig-bot"],
                 description="Generating SSH key pair"
             )
             
@@ -57,11 +69,13 @@ class SSHKeyInstaller(BaseInstaller):
         try:
             if pub_key_path.exists():
                 public_key = pub_key_path.read_text().strip()
-                self.console.print()
-                self.console.print("[bold cyan]Your SSH public key:[/bold cyan]")
-                self.console.print(f"[dim]{public_key}[/dim]")
-                self.console.print()
-                self.console.print("[dim]Add this key to GitHub, GitLab, or your server's ~/.ssh/authorized_keys[/dim]")
+                
+                # Render the whole block with a single print
+                text = Text("\n")
+                text.append("Your SSH public key:\n", style="bold cyan")
+                text.append(f"{public_key}\n\n", style="dim")
+                text.append("Add this key to GitHub, GitLab, or your server's ~/.ssh/authorized_keys", style="dim")
+                self.console.print(text)
         except Exception as e:
             self.console.print(f"[yellow]⚠[/yellow] Could not read public key: {e}")
 
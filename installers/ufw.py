@@ -2,65 +2,30 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """UFW firewall installer."""
 
-import shutil
-
-from utils.base import BaseInstaller
 from utils.types import InstallerResult
 
+from .apt import AptInstaller
+
+# Default policies, then SSH, HTTP and HTTPS
+UFW_RULES = [
+    ["default", "deny", "incoming"],
+    ["default", "allow", "outgoing"],
+    ["allow", "22/tcp"],
+    ["allow", "80"],
+    ["allow", "443"],
+]
 
-class UFWInstaller(BaseInstaller):
+
+class UFWInstaller(AptInstaller):
     """Install and configure UFW firewall."""
     
-    def is_installed(self) -> bool:
-        # Check if command exists first to avoid error logs
-        if not shutil.which("ufw"):
-            return False
-        
+    def post_apt(self) -> InstallerResult:
         try:
-            result = self.runner.run(["ufw", "--version"], check=False, capture_output=True)
-            return result.returncode == 0
-        except Exception:
-            return False
-    
-    def install(self) -> InstallerResult:
-        try:
-            self.console.print("[blue]ℹ[/blue] Installing UFW")
-            
-            self.runner.run(
-                ["apt", "install", "-y", "ufw"],
-                sudo=True,
-                description="Installing UFW"
-            )
-            
-            # Configure firewall rules
-            self.runner.run(
-                ["ufw", "default", "deny", "incoming"],
-                sudo=True,
-                description="Setting default deny incoming"
-            )
-            
+            # Configure firewall rules in one sudo call instead of one per rule
             self.runner.run(
-                ["ufw", "default", "allow", "outgoing"],
+                ["sh", "-c", " && ".join(" ".join(["ufw"] + rule) for rule in UFW_RULES)],
                 sudo=True,
-                description="Setting default allow outgoing"
-            )
-            
-            self.runner.run(
-                ["ufw", "allow", "22/tcp"],
-                sudo=True,
-                description="Allowing SSH"
-            )
-            
-            self.runner.run(
-                ["ufw", "allow", "80"],
-                sudo=True,
-                description="Allowing HTTP"
-            )
-            
-            self.runner.run(
-                ["ufw", "allow", "443"],
-                sudo=True,
-                description="Allowing HTTPS"
+                description="Configuring firewall rules"
             )
             
             self.console.print(
@@ -70,4 +35,3 @@ class UFWInstaller(BaseInstaller):
             return InstallerResult(True, "UFW installed and configured (not enabled)")
         except Exception as e:
             return InstallerResult(False, "Failed to install UFW", str(e))
-
@@ -2,37 +2,87 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """uv (Astral Python manager) installer."""
 
-import shutil
+import hashlib
+import io
+import os
+import platform
+import tarfile
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-from utils.base import BaseInstaller
+from utils.base import BaseInstaller, cache_installed
 from utils.types import InstallerResult
 
+RELEASE_URL = "https://github.com/astral-sh/uv/releases/latest/download"
+INSTALL_DIR = Path.home() / ".local" / "bin"
+
+# platform.machine() names mapped to uv release targets
+_TARGETS = {
+    "x86_64": "x86_64-unknown-linux-gnu",
+    "aarch64": "aarch64-unknown-linux-gnu",
+}
+
+
+def _fetch(url: str) -> bytes:
+    """Download a URL into memory."""
+    with urllib.request.urlopen(url, timeout=60) as response:
+        return response.read()
+
 
 class UVInstaller(BaseInstaller):
     """Install uv (Astral Python manager)."""
     
+    PARALLELIZABLE = True
+    
+    @cache_installed
     def is_installed(self) -> bool:
-        # Check if command exists first to avoid error logs
-        if not shutil.which("uv"):
-            return False
-        
-        try:
-            result = self.runner.run(["uv", "--version"], check=False, capture_output=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        # Answered from the PATH index, without running uv
+        return self.is_binary_installed("uv")
     
     def install(self) -> InstallerResult:
         try:
             self.console.print("[blue]ℹ[/blue] Installing uv")
             
-            install_script = "curl -LsSf https://astral.sh/uv/install.sh | sh"
-            self.runner.run(
-                ["bash", "-c", install_script],
-                description="Installing uv"
-            )
+            target = _TARGETS.get(platform.machine())
+            if target is None:
+                # No prebuilt tarball mapping, let the official script pick one
+                install_script = "curl -LsSf https://astral.sh/uv/install.sh | sh"
+                self.runner.run(
+                    ["bash", "-c", install_script],
+                    description="Installing uv"
+                )
+            else:
+                self._install_release(target)
             
             return InstallerResult(True, "uv installed successfully")
         except Exception as e:
             return InstallerResult(False, "Failed to install uv", str(e))
-
+    
+    def _install_release(self, target: str):
+        """Download the release tarball, verify its checksum and unpack uv and uvx."""
+        archive_name = f"uv-{target}.tar.gz"
+        archive_url = f"{RELEASE_URL}/{archive_name}"
+        
+        self.console.print("[dim]→ Downloading uv[/dim]")
+        self.logger.log("info", f"GET: {archive_url}")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            archive_future = executor.submit(_fetch, archive_url)
+            checksum_future = executor.submit(_fetch, f"{archive_url}.sha256")
+            archive = archive_future.result()
+            # Format: "<hex digest>  <file name>"
+            expected = checksum_future.result().decode().split()[0]
+        
+        if hashlib.sha256(archive).hexdigest() != expected:
+            raise ValueError(f"Checksum mismatch for {archive_name}")
+        
+        INSTALL_DIR.mkdir(parents=True, exist_ok=True)
+        with tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as tar:
+            for name in ("uv", "uvx"):
+                member = tar.getmember(f"uv-{target}/{name}")
+                source = tar.extractfile(member)
+                # Write beside the target and rename, so a running uv isn't overwritten
+                staging = INSTALL_DIR / f".{name}.tmp"
+                staging.write_bytes(source.read())
+                staging.chmod(0o755)
+                os.replace(staging, INSTALL_DIR / name)
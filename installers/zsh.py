@@ -2,56 +2,66 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """Zsh installer."""
 
-import subprocess
-from pathlib import Path
+import os
+import pwd
+import shutil
 
-from utils.base import BaseInstaller
+from utils.base import BaseInstaller, cache_installed
 from utils.types import InstallerResult
 
 
+def _zsh_path() -> str:
+    """Return the zsh binary on PATH, or where the package puts it."""
+    return shutil.which("zsh") or "/usr/bin/zsh"
+
+
+def _is_default_shell(zsh_path: str) -> bool:
+    """Check the login shell against zsh_path, e.g. /bin/zsh vs /usr/bin/zsh under usrmerge."""
+    login_shell = pwd.getpwuid(os.getuid()).pw_shell
+    return os.path.realpath(login_shell) == os.path.realpath(zsh_path)
+
+
 class ZshInstaller(BaseInstaller):
     """Install zsh and set it as default shell."""
     
+    # Set by install() when the zsh package was there before this run
+    _package_was_installed: bool = False
+    
+    @cache_installed
     def is_installed(self) -> bool:
         try:
-            result = self.runner.run(["zsh", "--version"], check=False, capture_output=True)
-            if result.returncode != 0:
+            # dpkg status comes from the batch query made by the setup manager
+            if not self.is_package_installed(["zsh"]):
                 return False
             
             # Check if zsh is already the default shell
-            try:
-                current_shell = Path("/etc/passwd").read_text()
-                # Get current user's shell
-                import os
-                username = os.getenv("USER") or os.getenv("USERNAME")
-                if username:
-                    for line in current_shell.split('\n'):
-                        if line.startswith(f"{username}:"):
-                            shell = line.split(':')[-1]
-                            return shell.endswith('/zsh')
-            except:
-                pass
-            
-            return True
-        except:
+            return _is_default_shell(_zsh_path())
+        except Exception:
             return False
     
     def install(self) -> InstallerResult:
         try:
             self.console.print("[blue]ℹ[/blue] Installing zsh")
             
-            # Install zsh
-            self.runner.run(
-                ["apt", "install", "-y", "zsh"],
-                sudo=True,
-                description="Installing zsh"
-            )
+            # Install zsh with the shared apt transaction, chsh runs afterwards
+            self._package_was_installed = self.is_package_installed(["zsh"])
+            self.queue_apt(["zsh"])
             
-            # Find zsh path
-            try:
-                zsh_path = subprocess.check_output(["which", "zsh"], text=True).strip()
-            except:
-                zsh_path = "/usr/bin/zsh"
+            return InstallerResult(True, "zsh installed and set as default shell")
+        except Exception as e:
+            return InstallerResult(False, "Failed to install zsh", str(e))
+    
+    def post_apt(self) -> InstallerResult:
+        try:
+            zsh_path = _zsh_path()
+            
+            # chsh goes through PAM, skip it when nothing would change
+            if _is_default_shell(zsh_path):
+                self.console.print("[dim]→ zsh is already the default shell[/dim]")
+                if self._package_was_installed:
+                    # Neither apt nor chsh had anything to do
+                    return InstallerResult(True, "zsh is already installed and the default shell", skipped=True)
+                return InstallerResult(True, "zsh installed (already the default shell)")
             
             # Set zsh as default shell (chsh doesn't need sudo for current user)
             self.console.print("[blue]ℹ[/blue] Setting zsh as default shell")
@@ -69,4 +79,3 @@ class ZshInstaller(BaseInstaller):
             return InstallerResult(True, "zsh installed and set as default shell")
         except Exception as e:
             return InstallerResult(False, "Failed to install zsh", str(e))
-
@@ -6,49 +6,27 @@ Beautiful system setup tool with rich UI and comprehensive error handling.
 Migrated from new1.sh with enhanced features.
 """
 
+import argparse
+import functools
+import io
 import sys
+import threading
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional
 
 from rich.console import Console
-from rich.panel import Panel
 from rich.prompt import Confirm
-from rich.table import Table
-from rich.text import Text
-from rich.traceback import install as install_rich_traceback
 from rich.spinner import Spinner
 from contextlib import contextmanager
 
-from utils import SetupLogger, CommandRunner, InstallerResult, InstallOption, BaseInstaller
+from utils import picker, result_cache
+from utils import SetupLogger, CommandRunner, InstallerResult, InstallOption, InstallerSpec, BaseInstaller
+from utils.runner import cancel_retries
 from utils.shell_config import update_shell_config
 from utils.errors import RigError
-from installers import (
-    BootstrapInstaller,
-    GitHubCLIInstaller,
-    UVInstaller,
-    NodeJSInstaller,
-    PNPMInstaller,
-    NeovimInstaller,
-    BTopInstaller,
-    NginxInstaller,
-    CertbotInstaller,
-    UFWInstaller,
-    Fail2banInstaller,
-    ImageViewerInstaller,
-    CurlpadInstaller,
-    DevToolsInstaller,
-    SSHKeyInstaller,
-    FastfetchInstaller,
-    PodmanInstaller,
-    ZshInstaller,
-    GitInstaller,
-    RkhunterInstaller,
-    ChkrootkitInstaller,
-    VRMSInstaller,
-)
-
-# Install rich traceback for better error display
-install_rich_traceback(show_locals=True)
+from installers import INSTALLER_META, load_installer
 
 # Initialize console
 console = Console()
@@ -65,183 +43,132 @@ def spinner_context(message: str):
             status.stop()
 
 
+@functools.cache
+def _render_welcome(width: int, color_system: Optional[str]) -> str:
+    """Render the welcome panel to an ANSI string, once per terminal setup."""
+    # Imported here, non-interactive runs never draw panels
+    from rich.panel import Panel
+    from rich.text import Text
+    
+    welcome_text = Text()
+    
+    # Title with emoji
+    welcome_text.append("🚀 ", style="bold blue")
+    welcome_text.append("rig", style="bold bright_white")
+    welcome_text.append(" - Opinionated system setup tool", style="bold white")
+    welcome_text.append(" v0.1.3", style="dim cyan")
+    
+    welcome_text.append("\n\n", style="white")
+    
+    # Description with better formatting
+    welcome_text.append("✨ ", style="yellow")
+    welcome_text.append(
+        "Opinionated system setup tool with basic tools to get started with in any Linux distribution.\n",
+        style="white"
+    )
+    welcome_text.append("📦 ", style="cyan")
+    welcome_text.append("No custom configurations, just the essential tools needed to be installed.", style="white")
+    
+    welcome_text.append("\n\n", style="white")
+    
+    # Separator line
+    welcome_text.append("─" * 50, style="dim")
+    welcome_text.append("\n\n", style="white")
+    
+    # Copyright and license with better styling
+    welcome_text.append("© ", style="dim")
+    welcome_text.append("Copyright (C) 2025 ", style="dim")
+    welcome_text.append("Akshat Kotpalliwar", style="bold dim cyan")
+    welcome_text.append(" (alias ", style="dim")
+    welcome_text.append("IntegerAlex", style="bold dim")
+    welcome_text.append(")", style="dim")
+    welcome_text.append("\n", style="white")
+    welcome_text.append("📜 ", style="dim")
+    welcome_text.append("License: ", style="dim")
+    welcome_text.append("GPL-3.0-only", style="bold dim green")
+    
+    panel = Panel(
+        welcome_text,
+        border_style="bright_blue",
+        padding=(1, 3),
+        title="[bold bright_blue]✨ Welcome to rig ✨[/bold bright_blue]",
+        title_align="center",
+        expand=False
+    )
+    
+    buffer = Console(
+        file=io.StringIO(),
+        force_terminal=True,
+        width=width,
+        color_system=color_system
+    )
+    buffer.print(panel)
+    buffer.print()
+    return buffer.file.getvalue()
+
+
+# Summary table label for each InstallerResult.status
+STATUS_LABELS = {
+    "success": "[green]✅ Success[/green]",
+    "skipped": "[dim]⏭️ Skipped[/dim]",
+    "failed": "[red]❌ Failed[/red]",
+}
+
+
 class SetupManager:
     """Main setup manager with beautiful UI."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        assume_yes: bool = False,
+        only: Optional[List[str]] = None,
+        use_cache: bool = True
+    ):
+        """
+        Args:
+            assume_yes: Install every tool that isn't installed yet without prompting
+            only: Installer keys to install without prompting, other tools are skipped
+            use_cache: Trust recent results in the on-disk result cache
+        """
         self.logger = SetupLogger()
         self.runner = CommandRunner(self.logger)
         self.console = console
+        self.assume_yes = assume_yes
+        self.only = only
+        self.use_cache = use_cache
         self.install_options = self._create_install_options()
         self.results: List[tuple[str, InstallerResult]] = []
+        # Result counts by InstallerResult.status, kept up to date by _add_result()
+        self._counters = {"success": 0, "skipped": 0, "failed": 0}
+        self._results_lock = threading.Lock()
     
     def _create_install_options(self) -> List[InstallOption]:
-        """Create list of installation options."""
+        """Create list of installation options from the installer registry."""
+        # Bootstrap always runs, --only limits the rest
+        specs = [
+            spec for index, spec in enumerate(INSTALLER_META)
+            if index == 0 or self.only is None or spec.key in self.only
+        ]
         return [
-            InstallOption(
-                "Bootstrap",
-                BootstrapInstaller(self.runner, self.logger),
-                "Initialize system with essential packages"
-            ),
-            InstallOption(
-                "GitHub CLI",
-                GitHubCLIInstaller(self.runner, self.logger),
-                "Install GitHub CLI (gh)"
-            ),
-            InstallOption(
-                "uv",
-                UVInstaller(self.runner, self.logger),
-                "Install uv (Astral Python manager)"
-            ),
-            InstallOption(
-                "Node.js",
-                NodeJSInstaller(self.runner, self.logger),
-                "Install Node.js via nvm"
-            ),
-            InstallOption(
-                "pnpm",
-                PNPMInstaller(self.runner, self.logger),
-                "Enable pnpm via corepack"
-            ),
-            InstallOption(
-                "Neovim",
-                NeovimInstaller(self.runner, self.logger),
-                "Install Neovim (latest release)"
-            ),
-            InstallOption(
-                "btop",
-                BTopInstaller(self.runner, self.logger),
-                "Install btop system monitor"
-            ),
-            InstallOption(
-                "nginx",
-                NginxInstaller(self.runner, self.logger),
-                "Install nginx web server"
-            ),
-            InstallOption(
-                "Certbot",
-                CertbotInstaller(self.runner, self.logger),
-                "Install Certbot (Let's Encrypt)"
-            ),
-            InstallOption(
-                "UFW",
-                UFWInstaller(self.runner, self.logger),
-                "Install and configure UFW firewall"
-            ),
-            InstallOption(
-                "Fail2ban",
-                Fail2banInstaller(self.runner, self.logger),
-                "Install and configure Fail2ban"
-            ),
-            InstallOption(
-                "Image Viewer",
-                ImageViewerInstaller(self.runner, self.logger),
-                "Install Advance Image Viewer"
-            ),
-            InstallOption(
-                "curlpad",
-                CurlpadInstaller(self.runner, self.logger),
-                "Install curlpad"
-            ),
-            InstallOption(
-                "Developer Tools",
-                DevToolsInstaller(self.runner, self.logger),
-                "Install developer tools (openssl, clangd, build-essential, etc.)"
-            ),
-            InstallOption(
-                "SSH Key",
-                SSHKeyInstaller(self.runner, self.logger),
-                "Generate SSH key pair (RSA 4096-bit) and display public key"
-            ),
-            InstallOption(
-                "fastfetch",
-                FastfetchInstaller(self.runner, self.logger),
-                "Install fastfetch system information tool"
-            ),
-            InstallOption(
-                "podman",
-                PodmanInstaller(self.runner, self.logger),
-                "Install podman container engine"
-            ),
-            InstallOption(
-                "zsh",
-                ZshInstaller(self.runner, self.logger),
-                "Install zsh and set it as default shell"
-            ),
-            InstallOption(
-                "git",
-                GitInstaller(self.runner, self.logger),
-                "Install git version control system"
-            ),
-            InstallOption(
-                "rkhunter",
-                RkhunterInstaller(self.runner, self.logger),
-                "Install rkhunter (Rootkit Hunter) security scanner"
-            ),
-            InstallOption(
-                "chkrootkit",
-                ChkrootkitInstaller(self.runner, self.logger),
-                "Install chkrootkit security scanner"
-            ),
-            InstallOption(
-                "vrms",
-                VRMSInstaller(self.runner, self.logger),
-                "Install vrms (Virtual Richard M. Stallman - lists non-free packages)"
-            ),
+            InstallOption(spec.title, partial(self._build_installer, spec), spec.description, spec=spec)
+            for spec in specs
         ]
     
+    def _build_installer(self, spec: InstallerSpec) -> BaseInstaller:
+        """Import and construct the installer for a spec."""
+        return load_installer(spec)(self.runner, self.logger, spec)
+    
     def show_welcome(self):
         """Display welcome message."""
-        welcome_text = Text()
-        
-        # Title with emoji
-        welcome_text.append("🚀 ", style="bold blue")
-        welcome_text.append("rig", style="bold bright_white")
-        welcome_text.append(" - Opinionated system setup tool", style="bold white")
-        welcome_text.append(" v0.1.3", style="dim cyan")
-        
-        welcome_text.append("\n\n", style="white")
-        
-        # Description with better formatting
-        welcome_text.append("✨ ", style="yellow")
-        welcome_text.append(
-            "Opinionated system setup tool with basic tools to get started with in any Linux distribution.\n",
-            style="white"
-        )
-        welcome_text.append("📦 ", style="cyan")
-        welcome_text.append("No custom configurations, just the essential tools needed to be installed.", style="white")
-        
-        welcome_text.append("\n\n", style="white")
-        
-        # Separator line
-        welcome_text.append("─" * 50, style="dim")
-        welcome_text.append("\n\n", style="white")
-        
-        # Copyright and license with better styling
-        welcome_text.append("© ", style="dim")
-        welcome_text.append("Copyright (C) 2025 ", style="dim")
-        welcome_text.append("Akshat Kotpalliwar", style="bold dim cyan")
-        welcome_text.append(" (alias ", style="dim")
-        welcome_text.append("IntegerAlex", style="bold dim")
-        welcome_text.append(")", style="dim")
-        welcome_text.append("\n", style="white")
-        welcome_text.append("📜 ", style="dim")
-        welcome_text.append("License: ", style="dim")
-        welcome_text.append("GPL-3.0-only", style="bold dim green")
-        
-        panel = Panel(
-            welcome_text,
-            border_style="bright_blue",
-            padding=(1, 3),
-            title="[bold bright_blue]✨ Welcome to rig ✨[/bold bright_blue]",
-            title_align="center",
-            expand=False
-        )
-        self.console.print(panel)
-        self.console.print()
+        self.console.file.write(_render_welcome(self.console.width, self.console.color_system))
+        self.console.file.flush()
     
     def show_summary(self):
         """Show installation summary with enhanced formatting and statistics."""
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
+        
         # Create enhanced table with better styling
         table = Table(
             title="📊 Installation Summary",
@@ -256,31 +183,21 @@ class SetupManager:
         table.add_column("📈 Status", style="magenta", no_wrap=True, min_width=12)
         table.add_column("💬 Details", style="white", min_width=30)
 
-        success_count = 0
-        fail_count = 0
-        skipped_count = 0
+        success_count = self._counters["success"]
+        fail_count = self._counters["failed"]
+        skipped_count = self._counters["skipped"]
+
+        # Parse each status label once and reuse the cell for every row
+        status_cells = {status: Text.from_markup(label) for status, label in STATUS_LABELS.items()}
 
         for name, result in self.results:
-            if result.success:
-                if "already installed" in result.message.lower():
-                    status = "[dim]⏭️ Skipped[/dim]"
-                    skipped_count += 1
-                else:
-                    status = "[green]✅ Success[/green]"
-                    success_count += 1
+            # Plain Text, so brackets in messages aren't parsed as markup
+            if result.display_error:
+                message = Text.assemble(result.message, " (", (result.display_error, "red"), ")")
             else:
-                status = "[red]❌ Failed[/red]"
-                fail_count += 1
+                message = Text(result.message)
 
-            message = result.message
-            if result.error:
-                # Truncate long error messages and add ellipsis
-                if len(result.error) > 60:
-                    message += f" ([red]{result.error[:57]}...[/red])"
-                else:
-                    message += f" ([red]{result.error}[/red])"
-
-            table.add_row(name, status, message)
+            table.add_row(name, status_cells[result.status], message)
 
         self.console.print()
         self.console.print(table)
@@ -315,17 +232,149 @@ class SetupManager:
         self.console.print(summary_panel)
         self.console.print()
     
+    def _run_step(self, option: InstallOption, step) -> Optional[InstallerResult]:
+        """Run an installer step, recording errors as failed results.
+
+        Returns None when the step raised and its failure was already recorded.
+        """
+        try:
+            return step()
+        except RigError as e:
+            # Handle custom rig errors with suggestions
+            error_result = InstallerResult(False, str(e), str(e))
+            self._add_result(option.name, error_result)
+            lines = [f"[red]✖[/red] {e.message}"]
+            if e.suggestion:
+                lines.append(f"[cyan]💡[/cyan] {e.suggestion}")
+            self.console.print("\n".join(lines))
+            self.logger.log("error", f"Error installing {option.name}: {e}")
+        except Exception as e:
+            error_result = InstallerResult(False, f"Unexpected error: {str(e)}", str(e))
+            self._add_result(option.name, error_result)
+            self.console.print(f"[red]✖[/red] Unexpected error: {e}")
+            self.logger.log("error", f"Unexpected error installing {option.name}: {e}")
+        return None
+    
+    def _check_installed(self, option: InstallOption) -> bool:
+        """Check if an option is installed and cache a yes for the next run."""
+        installed = option.installer.is_installed()
+        if installed:
+            result_cache.put(option.spec, InstallerResult(True, f"{option.name} is already installed"))
+        return installed
+    
+    def _add_result(self, name: str, result: InstallerResult):
+        """Store a result for the summary and count it."""
+        # Installer steps report from worker threads too
+        with self._results_lock:
+            self.results.append((name, result))
+            self._counters[result.status] += 1
+    
+    def _record_result(self, option: InstallOption, result: InstallerResult):
+        """Print and store the result of an installer."""
+        if result.success:
+            self.console.print(f"[green]✓[/green] {result.message}")
+            result_cache.put(option.spec, result)
+            option.installer.invalidate()
+        else:
+            lines = [f"[red]✖[/red] {result.message}"]
+            if result.error:
+                lines.append(f"[dim red]{result.error}[/dim red]")
+            self.console.print("\n".join(lines))
+        
+        self._add_result(option.name, result)
+    
+    def _collect_result(
+        self,
+        option: InstallOption,
+        result: InstallerResult,
+        pending: List[tuple[InstallOption, InstallerResult]]
+    ):
+        """Record a result, or defer it until queued apt packages are installed."""
+        if result.success and option.installer.queued_apt:
+            pending.append((option, result))
+        else:
+            self._record_result(option, result)
+    
+    def _install_apt_per_tool(
+        self,
+        pending: List[tuple[InstallOption, InstallerResult]]
+    ) -> List[tuple[InstallOption, InstallerResult]]:
+        """Install each installer's queued packages on its own.
+
+        Failures are recorded per tool. Returns the installers that are
+        ready for their post-apt steps.
+        """
+        ready = []
+        for option, result in pending:
+            self.console.print(f"[bold cyan]Installing packages for {option.name}...[/bold cyan]")
+            step_result = self._run_step(
+                option, lambda: option.installer.install_queued_apt() or result
+            )
+            if step_result is not None:
+                ready.append((option, step_result))
+        return ready
+    
+    def _finish_apt_installs(self, pending: List[tuple[InstallOption, InstallerResult]]):
+        """Install all queued apt packages at once, then run post-apt steps."""
+        self.console.print("[bold cyan]Installing queued packages...[/bold cyan]")
+        
+        try:
+            BaseInstaller.flush_apt(self.runner)
+        except Exception as e:
+            # A single package the distro lacks aborts the whole transaction,
+            # so give each installer its own attempt and fail only those tools
+            message = e.message if isinstance(e, RigError) else str(e)
+            self.console.print(f"[yellow]⚠[/yellow] Shared package install failed, retrying per tool: {message}")
+            self.logger.log("warning", f"Shared apt install failed, retrying per tool: {e}")
+            pending = self._install_apt_per_tool(pending)
+        
+        def post_apt(option: InstallOption, result: InstallerResult) -> Optional[InstallerResult]:
+            return self._run_step(option, lambda: option.installer.post_apt() or result)
+        
+        # Slow post-apt steps that don't prompt run side by side, as long as
+        # sudo won't ask for a password from a worker thread. They start only
+        # after the foreground steps, whose prompts (chsh asks through PAM)
+        # would otherwise be drawn over by the progress display
+        background = []
+        if self.runner.has_cached_sudo(refresh=True):
+            background = [item for item in pending if item[0].installer.PARALLEL_POST_APT]
+        foreground = [item for item in pending if item not in background]
+        
+        for option, result in foreground:
+            post_result = post_apt(option, result)
+            if post_result is not None:
+                self._record_result(option, post_result)
+        
+        if not background:
+            return
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [(option, executor.submit(post_apt, option, result)) for option, result in background]
+            
+            try:
+                for option, future in futures:
+                    post_result = future.result()
+                    if post_result is not None:
+                        self._record_result(option, post_result)
+            except KeyboardInterrupt:
+                # Leaving the pool waits for the workers, don't let them sit out a retry backoff
+                cancel_retries()
+                raise
+    
     def run(self):
         """Run the setup process."""
         self._start_time = time.time()
-        self.show_welcome()
+        # Panels are only worth drawing for a person watching a terminal
+        interactive = sys.stdout.isatty()
+        if interactive:
+            self.show_welcome()
         
         # Bootstrap is always run first
         bootstrap = self.install_options[0]
         self.console.print(f"[bold]Running bootstrap...[/bold]")
         # Don't use spinner for bootstrap as it may need sudo password input
         result = bootstrap.installer.install()
-        self.results.append((bootstrap.name, result))
+        self._add_result(bootstrap.name, result)
 
         if not result.success:
             print("✖ Bootstrap failed:", result.message)
@@ -338,19 +387,53 @@ class SetupManager:
         else:
             self.console.print(f"[green]✓[/green] Bootstrap completed\n")
 
-        # Ask for each option
-        selected_options = []
-        for option in self.install_options[1:]:  # Skip bootstrap
-            # Check if already installed
-            if hasattr(option.installer, 'is_installed'):
-                with spinner_context(f"Checking {option.name}..."):
-                    is_installed = option.installer.is_installed()
-                if is_installed:
-                    self.console.print(f"[dim]→ {option.name} is already installed, skipping[/dim]")
-                    continue
-
-            if Confirm.ask(f"[cyan]👉[/cyan] Install {option.name}?", default=False):
-                selected_options.append(option)
+        options = self.install_options[1:]  # Skip bootstrap
+        
+        # A valid cache entry answers for its tool with a few stat() calls,
+        # neither dpkg nor the installer is asked about it
+        if self.use_cache:
+            for option in options:
+                if result_cache.get(option.spec) is not None:
+                    option.installed = True
+        unchecked = [option for option in options if option.installed is None]
+        
+        # One dpkg-query answers is_installed() for every remaining apt-based tool
+        apt_packages = sorted({p for option in unchecked for p in option.spec.apt_packages})
+        if apt_packages:
+            try:
+                BaseInstaller.dpkg_status_batch(self.runner, apt_packages)
+            except Exception as e:
+                self.logger.log("warning", f"Could not query dpkg status: {e}")
+        
+        # Run every is_installed() check at once so the few that still wait
+        # on a subprocess overlap. Workers only return results, the spinner stays here
+        if unchecked:
+            with spinner_context("Checking installed tools..."):
+                with ThreadPoolExecutor(max_workers=min(16, len(unchecked))) as executor:
+                    checks = list(executor.map(self._check_installed, unchecked))
+            for option, installed in zip(unchecked, checks):
+                option.installed = installed
+        
+        offered = [option for option in options if not option.installed]
+        skipped_lines = [
+            f"[dim]→ {option.name} is already installed, skipping[/dim]"
+            for option in options if option.installed
+        ]
+        if skipped_lines:
+            # One print, so the whole block goes out in a single write
+            self.console.print("\n".join(skipped_lines))
+        
+        if self.assume_yes or self.only is not None:
+            selected_options = offered
+        elif offered and picker.is_supported():
+            # One checklist instead of a prompt per tool
+            selected_options = picker.pick(offered)
+        else:
+            # Ask for each option
+            selected_options = [
+                option for option in offered
+                if Confirm.ask(f"[cyan]👉[/cyan] Install {option.name}?", default=False)
+            ]
         
         if not selected_options:
             self.console.print("[yellow]No tools selected for installation.[/yellow]")
@@ -360,41 +443,59 @@ class SetupManager:
         self.console.print()
         self.console.print(f"[bold]Installing {len(selected_options)} tool(s)...[/bold]\n")
         
-        for option in selected_options:
-            self.console.print(f"[bold cyan]Installing {option.name}...[/bold cyan]")
+        # Installers that queued apt packages finish after the shared transaction
+        pending: List[tuple[InstallOption, InstallerResult]] = []
+        
+        # Network-only installers never take the dpkg lock, so fetch them concurrently
+        parallel_options = [o for o in selected_options if o.installer.PARALLELIZABLE]
+        serial_options = [o for o in selected_options if not o.installer.PARALLELIZABLE]
+        
+        # A sudo password prompt from a worker thread would be garbled by the
+        # others, so only go parallel when sudo won't ask
+        if parallel_options and not self.runner.has_cached_sudo(refresh=True):
+            self.logger.log("info", "sudo needs a password, running all installers serially")
+            serial_options = parallel_options + serial_options
+            parallel_options = []
+        
+        try:
+            if parallel_options:
+                self.console.print("\n".join(
+                    f"[bold cyan]Installing {option.name}...[/bold cyan]"
+                    for option in parallel_options
+                ))
+                
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    try:
+                        parallel_results = list(executor.map(
+                            lambda o: self._run_step(o, o.installer.install),
+                            parallel_options
+                        ))
+                    except KeyboardInterrupt:
+                        # Leaving the pool waits for the workers, don't let them sit out a retry backoff
+                        cancel_retries()
+                        raise
+                
+                for option, result in zip(parallel_options, parallel_results):
+                    if result is not None:
+                        self._collect_result(option, result, pending)
             
-            try:
+            for option in serial_options:
+                self.console.print(f"[bold cyan]Installing {option.name}...[/bold cyan]")
+                
                 # Don't use spinner for installations as they may need sudo password
                 # or show important output (similar to bootstrap)
-                result = option.installer.install()
-                
-                if result.success:
-                    self.console.print(f"[green]✓[/green] {result.message}")
-                else:
-                    self.console.print(f"[red]✖[/red] {result.message}")
-                    if result.error:
-                        self.console.print(f"[dim red]{result.error}[/dim red]")
-                
-                self.results.append((option.name, result))
-            except KeyboardInterrupt:
-                self.console.print("\n[yellow]⚠[/yellow] Installation interrupted by user")
-                break
-            except RigError as e:
-                # Handle custom rig errors with suggestions
-                error_result = InstallerResult(False, str(e), str(e))
-                self.results.append((option.name, error_result))
-                self.console.print(f"[red]✖[/red] {e.message}")
-                if e.suggestion:
-                    self.console.print(f"[cyan]💡[/cyan] {e.suggestion}")
-                self.logger.log("error", f"Error installing {option.name}: {e}")
-            except Exception as e:
-                error_result = InstallerResult(False, f"Unexpected error: {str(e)}", str(e))
-                self.results.append((option.name, error_result))
-                self.console.print(f"[red]✖[/red] Unexpected error: {e}")
-                self.logger.log("error", f"Unexpected error installing {option.name}: {e}")
+                result = self._run_step(option, option.installer.install)
+                if result is not None:
+                    self._collect_result(option, result, pending)
+            
+            if pending:
+                self._finish_apt_installs(pending)
+        except KeyboardInterrupt:
+            self.console.print("\n[yellow]⚠[/yellow] Installation interrupted by user")
         
         # Show summary
-        self.show_summary()
+        if interactive:
+            self.show_summary()
 
         # Update shell configuration
         self.console.print()
@@ -406,18 +507,49 @@ class SetupManager:
         self.console.print(f"[dim]📄 Log file: {self.logger.log_file}[/dim]")
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(
+        prog="rig",
+        description="Opinionated system setup tool"
+    )
+    parser.add_argument(
+        "-y", "--yes",
+        action="store_true",
+        help="install every tool that isn't installed yet without prompting"
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="TOOL",
+        choices=[spec.key for spec in INSTALLER_META[1:]],
+        help="install only this tool without prompting (repeatable): %(choices)s"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="check every tool again instead of trusting results from the last 24 hours"
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """Main entry point."""
     try:
-        manager = SetupManager()
+        args = parse_args()
+        manager = SetupManager(assume_yes=args.yes, only=args.only, use_cache=not args.no_cache)
         manager.run()
     except KeyboardInterrupt:
         print("\n⚠ Setup interrupted by user")
         sys.exit(1)
+    except EOFError:
+        # The terminal went away while waiting for input
+        print("\n⚠ Input closed, setup aborted")
+        sys.exit(1)
     except Exception as e:
         print(f"✖ Fatal error: {e}")
-        import traceback
-        traceback.print_exc()
+        # Rich tracebacks are only imported when something actually failed
+        console.print_exception(show_locals=True)
         sys.exit(1)
 
 
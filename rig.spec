@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_submodules
 
 
 a = Analysis(
@@ -6,7 +7,8 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['rich', 'utils', 'installers'],
+    # installers/ submodules are imported lazily, so list them explicitly
+    hiddenimports=['rich', 'utils', 'installers'] + collect_submodules('installers'),
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """Utility modules for the setup tool."""
 
-from .types import InstallerResult, InstallOption
+from .types import InstallerResult, InstallOption, InstallerSpec
 from .logger import SetupLogger
 from .runner import CommandRunner
 from .base import BaseInstaller
@@ -10,6 +10,7 @@ from .base import BaseInstaller
 __all__ = [
     "InstallerResult",
     "InstallOption",
+    "InstallerSpec",
     "SetupLogger",
     "CommandRunner",
     "BaseInstaller",
@@ -2,22 +2,88 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """Base installer class."""
 
+import functools
+import os
+import time
+from typing import List, Optional
+
 from rich.console import Console
 
 from .runner import CommandRunner
 from .logger import SetupLogger
-from .types import InstallerResult
+from .types import InstallerResult, InstallerSpec
 
 console = Console()
 
+# apt-get is the stable scripting interface; skip the dpkg PTY and
+# recommended packages to keep the transaction small
+APT_GET_INSTALL = [
+    "apt-get", "install", "-y",
+    "-o", "Dpkg::Use-Pty=0",
+    "-o", "APT::Install-Recommends=false",
+]
+
+# Touched by every apt-get update, used to tell if the package lists are fresh
+APT_LISTS_DIR = "/var/lib/apt/lists"
+
+# Translated package descriptions are never shown, don't download them
+APT_GET_UPDATE = ["apt-get", "update", "-o", "Acquire::Languages=none"]
+
+
+@functools.cache
+def _path_index() -> frozenset[str]:
+    """Return the names of all entries in $PATH, scanned once per process."""
+    names: set[str] = set()
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            names.update(os.listdir(directory))
+        except OSError:
+            # Missing or unreadable PATH entries are common, skip them
+            continue
+    return frozenset(names)
+
+
+def cache_installed(func):
+    """Memoize an installer's is_installed() result until invalidate() is called."""
+    @functools.wraps(func)
+    def wrapper(self) -> bool:
+        if self._installed_cache is None:
+            self._installed_cache = func(self)
+        return self._installed_cache
+    return wrapper
+
 
 class BaseInstaller:
     """Base class for all installers."""
     
-    def __init__(self, runner: CommandRunner, logger: SetupLogger):
+    # Set on installers that only fetch over the network and never take the
+    # dpkg lock, so they can run concurrently with each other
+    PARALLELIZABLE: bool = False
+    # Set on installers whose post_apt() never prompts and doesn't use dpkg,
+    # so it can run alongside the other post-apt steps
+    PARALLEL_POST_APT: bool = False
+    
+    # Packages queued by all installers, installed in one apt transaction
+    _apt_queue: set[str] = set()
+    # Full `apt-get update` runs at most once; sources added later are
+    # refreshed on their own
+    _apt_updated: bool = False
+    _apt_sources: List[str] = []
+    # Package -> dpkg status, filled by dpkg_status_batch()
+    _dpkg_status: Optional[dict[str, str]] = None
+    
+    def __init__(
+        self,
+        runner: CommandRunner,
+        logger: SetupLogger,
+        spec: Optional[InstallerSpec] = None
+    ):
         self.runner = runner
         self.logger = logger
+        self.spec = spec
         self.console = console
+        self.queued_apt: List[str] = []
+        self._installed_cache: Optional[bool] = None
     
     def install(self) -> InstallerResult:
         """Install the tool. Override in subclasses."""
@@ -26,4 +92,146 @@ class BaseInstaller:
     def is_installed(self) -> bool:
         """Check if tool is already installed. Override in subclasses."""
         return False
-
+    
+    def invalidate(self):
+        """Forget the cached is_installed() result, e.g. after installing."""
+        self._installed_cache = None
+        _path_index.cache_clear()
+        BaseInstaller._dpkg_status = None
+    
+    def is_binary_installed(self, name: str) -> bool:
+        """Check if a binary is on PATH, using the PATH index."""
+        return name in _path_index()
+    
+    def is_package_installed(self, packages: List[str]) -> bool:
+        """Check if all apt packages are installed according to dpkg.
+        
+        Packages not covered by an earlier dpkg_status_batch() are queried
+        together in one call.
+        """
+        statuses = BaseInstaller._dpkg_status or {}
+        missing = [package for package in packages if package not in statuses]
+        if missing:
+            self.dpkg_status_batch(self.runner, missing)
+            statuses = BaseInstaller._dpkg_status
+        
+        # e.g. "install ok installed" or "hold ok installed"
+        return all(statuses.get(package, "").endswith(" installed") for package in packages)
+    
+    def post_apt(self) -> Optional[InstallerResult]:
+        """Run steps that need the queued apt packages. Override in subclasses.
+        
+        Called by the orchestrator after flush_apt(). Returning None keeps
+        the result returned by install().
+        """
+        return None
+    
+    def queue_apt(self, packages: List[str]):
+        """Queue apt packages for the shared install transaction."""
+        self.queued_apt.extend(packages)
+        BaseInstaller._apt_queue.update(packages)
+    
+    def add_apt_source(self, list_path: str):
+        """Register a new sources.list.d file so its index gets refreshed."""
+        BaseInstaller._apt_sources.append(list_path)
+    
+    @classmethod
+    def ensure_apt_updated(cls, runner: CommandRunner, max_age: int = 300):
+        """Refresh apt package lists unless they are already fresh.
+        
+        Args:
+            runner: Command runner used for apt-get
+            max_age: Lists younger than this many seconds are reused
+        """
+        if not BaseInstaller._apt_updated:
+            try:
+                age = time.time() - os.stat(APT_LISTS_DIR).st_mtime
+            except OSError:
+                age = float("inf")
+            
+            if age >= max_age:
+                runner.run(APT_GET_UPDATE, sudo=True, description="Updating package lists")
+                # A full update already covers any registered sources
+                BaseInstaller._apt_sources.clear()
+            BaseInstaller._apt_updated = True
+        
+        # Only refresh the lists added since, instead of every source
+        for list_path in BaseInstaller._apt_sources:
+            runner.run(
+                APT_GET_UPDATE +
+                ["-o", f"Dir::Etc::sourcelist={list_path}",
+                 "-o", "Dir::Etc::sourceparts=-",
+                 "-o", "APT::Get::List-Cleanup=0"],
+                sudo=True,
+                description=f"Updating {os.path.basename(list_path)}"
+            )
+        BaseInstaller._apt_sources.clear()
+    
+    @classmethod
+    def dpkg_status_batch(cls, runner: CommandRunner, packages: List[str]) -> dict[str, str]:
+        """Query the dpkg status of several packages with one dpkg-query call.
+        
+        Results are cached for is_package_installed(). Packages dpkg doesn't
+        know about are recorded with an empty status.
+        
+        Returns:
+            Mapping of package name to its dpkg status string
+        """
+        result = runner.run(
+            ["dpkg-query", "-W", "-f=${Package}\t${Status}\n"] + list(packages),
+            check=False,
+            capture_output=True
+        )
+        
+        statuses = dict.fromkeys(packages, "")
+        for line in (result.stdout or "").splitlines():
+            # Lines without a tab are dpkg-query warnings about unknown packages
+            package, sep, status = line.partition("\t")
+            if sep:
+                statuses[package] = status
+        
+        if BaseInstaller._dpkg_status is None:
+            BaseInstaller._dpkg_status = {}
+        BaseInstaller._dpkg_status.update(statuses)
+        return statuses
+    
+    @classmethod
+    def _apt_install(cls, runner: CommandRunner, packages: List[str]):
+        """Run apt-get install for packages, refreshing the lists first if needed."""
+        # One progress display for the list updates and the install
+        with runner.progress_session():
+            cls.ensure_apt_updated(runner)
+            # eatmydata drops dpkg's per-file fsync calls, use it if the user has it
+            wrapper = ["eatmydata"] if "eatmydata" in _path_index() else []
+            runner.run(
+                wrapper + APT_GET_INSTALL + packages,
+                sudo=True,
+                description=f"Installing {len(packages)} package(s)"
+            )
+    
+    @classmethod
+    def flush_apt(cls, runner: CommandRunner):
+        """Install every queued apt package in a single transaction.
+        
+        The queue is emptied even if apt fails. One unavailable package
+        aborts the whole transaction, so callers then fall back to
+        install_queued_apt() on each installer.
+        """
+        if not BaseInstaller._apt_queue:
+            return
+        
+        try:
+            # Drop packages dpkg already has, e.g. git queued by both git and
+            # Developer Tools on a machine that ships it, to keep the resolver's job small
+            statuses = cls.dpkg_status_batch(runner, sorted(BaseInstaller._apt_queue))
+            packages = [package for package, status in statuses.items() if not status.endswith(" installed")]
+            
+            if packages:
+                cls._apt_install(runner, packages)
+        finally:
+            BaseInstaller._apt_queue.clear()
+    
+    def install_queued_apt(self):
+        """Install only this installer's queued packages, after a failed flush_apt()."""
+        if self.queued_apt:
+            self._apt_install(self.runner, self.queued_apt)
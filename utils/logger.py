@@ -2,7 +2,11 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """Logging utilities for the setup tool."""
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import tempfile
 from pathlib import Path
 
@@ -14,67 +18,63 @@ console = Console()
 
 # Logging setup
 LOG_FILE = Path("/var/log/setup.log")
+# Remembers which log location was writable on the last run
+LOG_PATH_CACHE = Path.home() / ".cache" / "rig" / "logpath"
 
 
 class SetupLogger:
     """Centralized logging with both file and console output."""
     
     def __init__(self, log_file: Path = LOG_FILE):
-        self.log_file = log_file
-        self._setup_log_file()
+        self.log_file = self._pick_log_path(log_file)
+        self._listener = None
         self.logger = self._setup_logger()
     
-    def _setup_log_file(self):
-        """Create log file with proper permissions."""
-        try:
-            if not self.log_file.exists():
-                # Try to create log file (may require sudo)
-                try:
-                    self.log_file.parent.mkdir(parents=True, exist_ok=True)
-                    self.log_file.touch()
-                    self.log_file.chmod(0o644)
-                except (PermissionError, OSError):
-                    # Fallback to user's home directory
-                    self.log_file = Path.home() / ".setup.log"
-                    self.log_file.touch()
-                    # Suppress the warning - it's not critical
-                    pass
-        except Exception as e:
-            console.print(f"[red]✖[/red] Failed to setup log file: {e}")
-            self.log_file = Path.home() / ".setup.log"
-            self.log_file.touch()
-    
-    def _ensure_writable_log_file(self):
-        """Ensure the log file is writable, fallback if not."""
-        # Test if we can write to the current log file
-        try:
-            # Try to open in append mode to test write permissions
-            with open(self.log_file, "a"):
+    def _pick_log_path(self, preferred: Path) -> Path:
+        """Pick the first writable log file location.
+        
+        Uses os.access instead of creating test files, and remembers the
+        choice in LOG_PATH_CACHE so later runs can skip the probing.
+        """
+        # The cache only describes the default location
+        if preferred == LOG_FILE:
+            try:
+                cached = Path(LOG_PATH_CACHE.read_text().strip())
+                if self._is_writable(cached):
+                    return cached
+            except OSError:
                 pass
-        except (PermissionError, OSError):
+        
+        candidates = [
+            preferred,
             # Fallback to user's home directory
-            fallback_log = Path.home() / ".setup.log"
+            Path.home() / ".setup.log",
+            # Last resort: use a temp file
+            Path(tempfile.gettempdir()) / "setup.log",
+        ]
+        chosen = next((path for path in candidates if self._is_writable(path)), candidates[-1])
+        
+        if preferred == LOG_FILE:
             try:
-                fallback_log.touch()
-                self.log_file = fallback_log
-                # Suppress warning - fallback is working fine
-                pass
-            except Exception as e:
-                console.print(f"[red]✖[/red] Failed to create fallback log file: {e}")
-                # Last resort: use a temp file
-                self.log_file = Path(tempfile.gettempdir()) / "setup.log"
-                self.log_file.touch()
-                # Suppress warning - temporary log is working fine
+                LOG_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                LOG_PATH_CACHE.write_text(str(chosen))
+            except OSError:
+                # Not critical, the next run just probes again
                 pass
+        return chosen
+    
+    @staticmethod
+    def _is_writable(path: Path) -> bool:
+        """Check if a log file can be appended to or created."""
+        if path.exists():
+            return os.access(path, os.W_OK)
+        return os.access(path.parent, os.W_OK)
     
     def _setup_logger(self) -> logging.Logger:
         """Configure logger with rich handler."""
         logger = logging.getLogger("setup")
         logger.setLevel(logging.DEBUG)
         
-        # Ensure log file is writable
-        self._ensure_writable_log_file()
-        
         # File handler
         try:
             file_handler = logging.FileHandler(self.log_file, mode="a")
@@ -84,7 +84,14 @@ class SetupLogger:
                 datefmt="%Y-%m-%d %H:%M:%S"
             )
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+            
+            # Disk writes happen on a listener thread so a slow log file
+            # never holds up the installers
+            log_queue = queue.SimpleQueue()
+            self._listener = logging.handlers.QueueListener(log_queue, file_handler)
+            self._listener.start()
+            atexit.register(self.close)
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
         except (PermissionError, OSError) as e:
             # If we still can't create the handler, log a warning but continue
             console.print(f"[yellow]⚠[/yellow] Could not create file logger: {e}")
@@ -102,7 +109,16 @@ class SetupLogger:
         
         return logger
     
-    def log(self, level: str, message: str):
-        """Log a message at the specified level."""
-        getattr(self.logger, level.lower())(message)
-
+    def log(self, level: str, message: str, *args):
+        """Log a message at the specified level.
+        
+        Like logging, %-style args are only merged into the message when
+        the record is formatted.
+        """
+        getattr(self.logger, level.lower())(message, *args)
+    
+    def close(self):
+        """Write out queued file log records."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
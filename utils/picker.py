@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (C) 2025 Akshat Kotpalliwar (alias IntegerAlex) <inquiry.akshatkotpalliwar@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+"""Interactive checklist for choosing several install options at once."""
+
+import os
+import select
+import sys
+from typing import List
+
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+
+from .types import InstallOption
+
+console = Console()
+
+# Seconds to wait for the rest of an escape sequence after an Esc byte
+ESCAPE_TIMEOUT = 0.01
+
+# Keys that move the cursor, the arrow escape sequences and vi-style k/j
+KEY_UP = ("\x1b[A", "k")
+KEY_DOWN = ("\x1b[B", "j")
+
+
+def is_supported() -> bool:
+    """Check if the checklist can run, i.e. stdin is a terminal with termios."""
+    try:
+        import termios  # noqa: F401
+    except ImportError:
+        return False
+    return sys.stdin.isatty()
+
+
+def _read_key(fd: int) -> str:
+    """Read one key press, including multi-byte escape sequences.
+
+    The terminal sends a whole sequence at once, so if nothing follows an
+    escape within ESCAPE_TIMEOUT seconds it was a bare Esc press.
+
+    Raises:
+        EOFError: If the terminal is gone, e.g. after a hangup
+    """
+    data = os.read(fd, 1)
+    if not data:
+        raise EOFError("terminal closed")
+    key = data.decode(errors="ignore")
+    if key == "\x1b" and select.select([fd], [], [], ESCAPE_TIMEOUT)[0]:
+        key += os.read(fd, 2).decode(errors="ignore")
+    return key
+
+
+def _render(options: List[InstallOption], selected: set[int], cursor: int) -> Table:
+    """Build the checklist table for the current state."""
+    table = Table(
+        title="Select tools to install",
+        caption="↑/↓ move · space toggle · a all · enter confirm",
+        box=None,
+        show_header=False,
+        padding=(0, 1)
+    )
+    table.add_column(no_wrap=True)
+    table.add_column(style="cyan bold", no_wrap=True)
+    table.add_column(style="dim")
+
+    for index, option in enumerate(options):
+        checkbox = "[green]◉[/green]" if index in selected else "○"
+        pointer = "[bold cyan]❯[/bold cyan]" if index == cursor else " "
+        table.add_row(f"{pointer} {checkbox}", option.name, option.description)
+    return table
+
+
+def pick(options: List[InstallOption]) -> List[InstallOption]:
+    """Let the user tick options in one checklist instead of one prompt each.
+
+    Args:
+        options: Options to offer, in display order
+
+    Returns:
+        The selected options, in display order
+
+    Raises:
+        KeyboardInterrupt: If the user pressed Ctrl+C
+        EOFError: If the terminal closed while waiting for a key
+    """
+    import termios
+    import tty
+
+    selected: set[int] = set()
+    cursor = 0
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+
+    try:
+        tty.setcbreak(fd)
+        with Live(_render(options, selected, cursor), console=console, auto_refresh=False) as live:
+            while True:
+                key = _read_key(fd)
+                if key in ("\r", "\n"):
+                    break
+                if key in KEY_UP:
+                    cursor = (cursor - 1) % len(options)
+                elif key in KEY_DOWN:
+                    cursor = (cursor + 1) % len(options)
+                elif key == " ":
+                    selected ^= {cursor}
+                elif key == "a":
+                    selected = set() if len(selected) == len(options) else set(range(len(options)))
+                else:
+                    continue
+                live.update(_render(options, selected, cursor), refresh=True)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+    return [option for index, option in enumerate(options) if index in selected]
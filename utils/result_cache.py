@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: Copyright (C) 2025 Akshat Kotpalliwar (alias IntegerAlex) <inquiry.akshatkotpalliwar@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+"""On-disk cache of successful installs, so re-runs skip known tools."""
+
+import json
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import Optional
+
+from .types import InstallerResult, InstallerSpec
+
+CACHE_DIR = Path.home() / ".cache" / "rig" / "results"
+DEFAULT_TTL = 24 * 60 * 60
+
+# dpkg keeps one file list per installed package here, rewritten whenever
+# the package is installed or upgraded and deleted when it is removed
+DPKG_INFO_DIR = "/var/lib/dpkg/info"
+
+
+def _cache_file(name: str) -> Path:
+    """Map an option name like "GitHub CLI" to its cache file."""
+    return CACHE_DIR / f"{re.sub(r'[^a-z0-9]+', '_', name.lower())}.json"
+
+
+def _stat_entry(path: str) -> Optional[list]:
+    """Return [path, inode, mtime] for a file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [path, stat.st_ino, stat.st_mtime_ns]
+
+
+def _signature(spec: InstallerSpec) -> Optional[list]:
+    """Return what identifies the installed copy of one tool.
+
+    That is the dpkg file list of each of its apt_packages and the file each
+    of its check_binary names resolves to on PATH. Only stat() calls, no
+    subprocess.
+
+    Returns:
+        The signature, or None if the tool has nothing to check or one of
+        its packages isn't installed
+    """
+    signature = []
+    for package in spec.apt_packages:
+        entry = _stat_entry(os.path.join(DPKG_INFO_DIR, f"{package}.list"))
+        if entry is None:
+            return None
+        signature.append(entry)
+
+    for binary in spec.check_binary:
+        path = shutil.which(binary)
+        # A binary that is missing now but appears later changes the signature too
+        signature.append(_stat_entry(path) if path else [binary, None])
+
+    if not any(entry[-1] is not None for entry in signature):
+        return None
+    return signature
+
+
+def get(spec: InstallerSpec, ttl: int = DEFAULT_TTL) -> Optional[InstallerResult]:
+    """Return the cached result for a tool if it is fresh and still valid.
+
+    An entry is only trusted while it is younger than ttl seconds and the
+    tool's own packages and binaries are the ones it was written for.
+
+    Args:
+        spec: Installer spec of the tool
+        ttl: Maximum age of the entry in seconds
+
+    Returns:
+        The cached InstallerResult, or None if missing, stale, outdated by a
+        change to the tool, or unreadable
+    """
+    path = _cache_file(spec.title)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        data = json.loads(path.read_text())
+        signature = _signature(spec)
+        if signature is None or data.get("signature") != signature:
+            return None
+        return InstallerResult(data["success"], data["message"], data.get("error"))
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def put(spec: InstallerSpec, result: InstallerResult):
+    """Remember a successful result for a tool.
+
+    Failures are never cached, nor are tools without a signature, those
+    are simply checked again next time.
+    """
+    if not result.success:
+        return
+
+    signature = _signature(spec)
+    if signature is None:
+        return
+
+    path = _cache_file(spec.title)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "success": result.success,
+            "message": result.message,
+            "error": result.error,
+            "signature": signature,
+        }))
+    except OSError:
+        # Not critical, the tool is just checked again next time
+        pass
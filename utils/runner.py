@@ -2,12 +2,18 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """Command execution utilities."""
 
+import collections
 import os
+import random
+import re
+import selectors
+import shutil
 import subprocess
 import sys
 import threading
 import time
 from typing import List, Optional, Callable, Any
+from contextlib import contextmanager
 from functools import wraps
 
 from rich.console import Console
@@ -18,6 +24,49 @@ from .errors import NetworkError, CommandNotFoundError, PermissionError, Package
 
 console = Console()
 
+# apt output lines worth showing on the console, matched on raw bytes
+_APT_ERROR_RE = re.compile(rb"error|failed|warning|cannot|unable|e:", re.IGNORECASE)
+_APT_CLI_WARNING_RE = re.compile(rb"apt does not have a stable cli interface", re.IGNORECASE)
+
+# apt output lines kept for error reports, the full output goes to the log
+APT_OUTPUT_TAIL = 50
+
+# How long a passing sudo -n probe is trusted, well below sudo's own
+# credential timeout, so an expired timestamp is noticed again
+SUDO_PROBE_TTL = 30
+
+# Commands that download, so they are retried and show progress
+NETWORK_TOOLS = frozenset({"curl", "wget"})
+
+# Environment overrides for apt commands, to suppress prompts and warnings
+APT_ENV = {
+    "DEBIAN_FRONTEND": "noninteractive",
+    "APT_LISTCHANGES_FRONTEND": "none",
+    "DEBCONF_NONINTERACTIVE_SEEN": "true",
+    # Skip locale lookups and translated output
+    "LC_ALL": "C.UTF-8",
+}
+
+
+class _CommandLine:
+    """A command for log messages, only joined if the record gets formatted."""
+    __slots__ = ("command",)
+    
+    def __init__(self, command: List[str]):
+        self.command = command
+    
+    def __str__(self) -> str:
+        return " ".join(self.command)
+
+
+# Set once the user interrupts the run, so pending retries stop waiting
+_retries_cancelled = threading.Event()
+
+
+def cancel_retries():
+    """Make network retries waiting in a backoff give up immediately."""
+    _retries_cancelled.set()
+
 
 def retry_on_network_error(max_attempts: int = 3, backoff_factor: float = 1.0):
     """Decorator to retry network operations with exponential backoff.
@@ -45,11 +94,14 @@ def retry_on_network_error(max_attempts: int = 3, backoff_factor: float = 1.0):
                     if attempt == max_attempts - 1:
                         break
 
-                    # Calculate backoff delay: 1s, 2s, 4s...
-                    delay = backoff_factor * (2 ** attempt)
-                    console.print(f"[yellow]⚠[/yellow] Network operation failed, retrying in {delay}s... ({attempt + 1}/{max_attempts})")
+                    # Calculate backoff delay: 1s, 2s, 4s..., with jitter so
+                    # parallel installers don't retry in lockstep
+                    delay = backoff_factor * (2 ** attempt) * random.uniform(0.8, 1.2)
+                    console.print(f"[yellow]⚠[/yellow] Network operation failed, retrying in {delay:.1f}s... ({attempt + 1}/{max_attempts})")
 
-                    time.sleep(delay)
+                    # Unlike time.sleep(), this can be cut short from another thread
+                    if _retries_cancelled.wait(delay):
+                        raise KeyboardInterrupt
 
             # If we get here, all retries failed
             if last_exception:
@@ -72,50 +124,203 @@ class CommandRunner:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeRemainingColumn(),
             console=console,
-            transient=True
+            transient=True,
+            # A spinner doesn't need the default 10 frames per second
+            refresh_per_second=4
         )
+        # Nobody watches the spinner in CI or when output is redirected
+        self._use_progress = console.is_terminal and not os.environ.get("CI")
+        # Installers may run commands from several threads at once, so the
+        # progress display is shared and only stopped by the last user
+        self._progress_lock = threading.Lock()
+        self._progress_users = 0
+        # sudo probes, sudo being installed is answered once, passwordless
+        # sudo only holds for SUDO_PROBE_TTL seconds
+        self._sudo_available: Optional[bool] = None
+        self._sudo_passwordless_at: Optional[float] = None
+        # Built once, other commands simply inherit os.environ
+        self._apt_env = {**os.environ, **APT_ENV}
     
-    def _check_sudo_available(self) -> bool:
-        """Check if sudo is available and can be used."""
+    def _start_progress(self, description: Optional[str] = None) -> Optional[int]:
+        """Add a progress task, or just hold the display open without one."""
+        with self._progress_lock:
+            task_id = None
+            if description is not None:
+                task_id = self.progress.add_task(description, total=None)
+            if self._progress_users == 0:
+                self.progress.start()
+            self._progress_users += 1
+        return task_id
+    
+    def _stop_progress(self, task_id: Optional[int]):
+        """Remove a progress task, stopping the display when no user remains."""
+        with self._progress_lock:
+            if task_id is not None:
+                self.progress.remove_task(task_id)
+            self._progress_users -= 1
+            if self._progress_users == 0:
+                self.progress.stop()
+    
+    @contextmanager
+    def progress_session(self):
+        """Keep the progress display running across several run() calls.
+
+        Commands inside the session only add and remove their task instead
+        of starting and stopping the display each time. Don't wrap anything
+        that may prompt, the display would draw over the prompt.
+        """
+        if not self._use_progress:
+            yield
+            return
+        
+        self._start_progress()
         try:
-            result = subprocess.run(
-                ["sudo", "-n", "true"],
-                capture_output=True,
-                timeout=2
-            )
-            # If -n (non-interactive) works, we have passwordless sudo
-            if result.returncode == 0:
-                return True
-            # Otherwise, check if sudo exists
-            subprocess.run(["which", "sudo"], check=True, capture_output=True, timeout=1)
+            yield
+        finally:
+            self._stop_progress(None)
+    
+    def _check_sudo_available(self) -> bool:
+        """Check if sudo is available and can be used. Checked once per runner."""
+        if self._sudo_available is None:
+            # If -n (non-interactive) works, we have passwordless sudo,
+            # otherwise it is enough that sudo exists
+            self._sudo_available = self.has_cached_sudo() or shutil.which("sudo") is not None
+        return self._sudo_available
+    
+    def has_cached_sudo(self, refresh: bool = False) -> bool:
+        """Check if sudo can run without prompting for a password.
+
+        Only the sudo -n probe decides. A yes is reused for SUDO_PROBE_TTL
+        seconds, a no is never reused, since the next sudo command that
+        succeeds may leave the credentials cached.
+
+        Args:
+            refresh: Probe again even if a recent yes is remembered
+        """
+        checked_at = self._sudo_passwordless_at
+        if not refresh and checked_at is not None and time.monotonic() - checked_at < SUDO_PROBE_TTL:
             return True
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        
+        try:
+            result = subprocess.run(["sudo", "-n", "true"], capture_output=True, timeout=2)
+            passwordless = result.returncode == 0
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            passwordless = False
+        self._sudo_passwordless_at = time.monotonic() if passwordless else None
+        return passwordless
+    
+    def _head_index(self, command: List[str]) -> int:
+        """Return the position of the program a command runs, skipping wrappers."""
+        index = 0
+        while index < len(command) and command[index] in ("sudo", "eatmydata"):
+            index += 1
+        return index
+    
+    def _apt_index(self, command: List[str]) -> Optional[int]:
+        """Return the position of apt/apt-get in a command, skipping wrappers."""
+        index = self._head_index(command)
+        if index < len(command) and command[index] in ("apt", "apt-get"):
+            return index
+        return None
     
-    def _is_network_command(self, command: List[str]) -> bool:
-        """Check if command is network-related (should be retried)."""
-        cmd_str = " ".join(command).lower()
-        return any(network_indicator in cmd_str for network_indicator in [
-            "curl", "wget", "apt update", "apt-get update"
-        ])
-
-    def _is_long_running_command(self, command: List[str]) -> bool:
-        """Check if command is likely to take a long time (should show progress)."""
-        cmd_str = " ".join(command).lower()
-        return any(long_running in cmd_str for long_running in [
-            "apt update", "apt install", "apt-get update", "apt-get install",
-            "curl", "wget", "git clone"
-        ])
+    def _apt_subcommand(self, command: List[str]) -> Optional[str]:
+        """Return the apt-get subcommand, e.g. "update", skipping sudo and options."""
+        apt_idx = self._apt_index(command)
+        if apt_idx is None:
+            return None
+        
+        rest = iter(command[apt_idx + 1:])
+        for arg in rest:
+            if arg == "-o":
+                # -o takes the configuration item as a separate argument
+                next(rest, None)
+            elif not arg.startswith("-"):
+                return arg
+        return None
+    
+    def _with_apt_flags(self, command: List[str], apt_idx: int) -> List[str]:
+        """Return a copy of an apt command with quiet and non-interactive options added.
 
-    @retry_on_network_error(max_attempts=3, backoff_factor=1.0)
-    def _run_with_retry(self,
-                       command: List[str],
-                       check: bool = True,
-                       capture_output: bool = False,
-                       text: bool = True,
-                       stdin=None,
-                       env=None) -> subprocess.CompletedProcess:
-        """Run command with retry logic for network operations."""
+        The new list is built in one pass instead of inserting into the
+        caller's list.
+        """
+        present = set(command)
+        # Add -qq (very quiet) flag to apt commands to suppress verbose output
+        # This suppresses "Reading package lists..." messages completely
+        quiet_after = None
+        if not present & {"-q", "-qq", "-qqq"}:
+            # After "apt" for updates, after "install" for installs
+            if "update" in present:
+                quiet_after = command[apt_idx]
+            elif "install" in present:
+                quiet_after = "install"
+        
+        args = command[apt_idx + 1:]
+        flag_count = 0
+        while flag_count < len(args) and args[flag_count].startswith("-"):
+            flag_count += 1
+        
+        result = command[:apt_idx + 1]
+        if quiet_after == command[apt_idx]:
+            result.append("-qq")
+            quiet_after = None
+        result.extend(args[:flag_count])
+        # Suppress apt CLI warnings by redirecting status messages,
+        # inserted after any existing flags
+        if "-o" not in present:
+            result.extend(["-o", "APT::Status-Fd=/dev/null"])
+        for arg in args[flag_count:]:
+            result.append(arg)
+            if arg == quiet_after:
+                result.append("-qq")
+                quiet_after = None
+        # Never draw dpkg's progress bar, it only scrolls the terminal
+        if "Dpkg::Progress-Fancy=0" not in present:
+            result.extend(["-o", "Dpkg::Progress-Fancy=0"])
+        return result
+
+    def _classify_command(self, command: List[str]) -> tuple[bool, bool]:
+        """Classify a command by the program it runs and any shell strings.
+
+        Returns:
+            (is_network, is_long_running): network commands are retried,
+            long-running ones show progress
+        """
+        apt_subcommand = self._apt_subcommand(command)
+        if apt_subcommand is not None:
+            # Package names like curl or wget are only arguments here
+            return apt_subcommand == "update", apt_subcommand in ("update", "install")
+        
+        head = self._head_index(command)
+        program = os.path.basename(command[head]) if head < len(command) else ""
+        if program in NETWORK_TOOLS:
+            return True, True
+        is_long_running = program == "git" and command[head + 1:head + 2] == ["clone"]
+        
+        # Shell strings, e.g. "curl ... | sh" passed to bash -c, are split into
+        # words. Other plain arguments are file or package names
+        for arg in command[head + 1:]:
+            words = arg.split()
+            if len(words) < 2:
+                continue
+            previous = None
+            for word in words:
+                word = os.path.basename(word)
+                if word in NETWORK_TOOLS:
+                    return True, True
+                if previous == "git" and word == "clone":
+                    is_long_running = True
+                previous = word
+        return False, is_long_running
+
+    def _run_once(self,
+                  command: List[str],
+                  check: bool = True,
+                  capture_output: bool = False,
+                  text: bool = True,
+                  stdin=None,
+                  env=None) -> subprocess.CompletedProcess:
+        """Run command once, merging stderr into stdout when capturing output."""
         if capture_output:
             return subprocess.run(
                 command,
@@ -134,6 +339,126 @@ class CommandRunner:
                 env=env
             )
 
+    @retry_on_network_error(max_attempts=3, backoff_factor=1.0)
+    def _run_with_retry(self, command: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """Run command with retry logic for network operations."""
+        return self._run_once(command, **kwargs)
+
+    def _run_apt(self, command: List[str], check: bool, env) -> subprocess.CompletedProcess:
+        """Run an apt command, logging its output and showing only errors.
+
+        The -qq flag suppresses most output already. stderr is merged into
+        stdout and read as it arrives, so a full pipe never stalls apt. Every
+        line is written to the log, the returned stdout only holds the last
+        APT_OUTPUT_TAIL lines.
+        """
+        process = subprocess.Popen(
+            command,
+            stdin=sys.stdin,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # Merge stderr into stdout
+            env=env  # Use modified environment
+        )
+
+        # Read output in real-time to prevent hanging
+        output_lines = collections.deque(maxlen=APT_OUTPUT_TAIL)
+        error_lines = []
+
+        def handle_line(raw: bytes):
+            raw = raw.rstrip()
+            # Filter out apt CLI interface warnings completely
+            if not raw or _APT_CLI_WARNING_RE.search(raw):
+                return
+            line = raw.decode(errors="replace")
+            output_lines.append(line)
+            # Log to file immediately (warnings filtered out)
+            self.logger.log("info", line)
+            # Check if it's an error/warning for console display
+            if _APT_ERROR_RE.search(raw):
+                error_lines.append(line)
+
+        # Drain the pipe from this thread with a selector. Daemons
+        # started by maintainer scripts can inherit the pipe and keep
+        # it open, so stop once apt has exited and nothing is pending
+        # instead of waiting for EOF
+        returncode = None
+        pending = b""
+        fd = process.stdout.fileno()
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while True:
+                if selector.select(timeout=0.1):
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    *lines, pending = (pending + chunk).split(b"\n")
+                    for raw in lines:
+                        handle_line(raw)
+                elif returncode is not None:
+                    break
+                else:
+                    returncode = process.poll()
+        if pending:
+            handle_line(pending)
+        process.stdout.close()
+        returncode = process.wait()
+
+        # Show errors/warnings on console
+        if error_lines:
+            for line in error_lines:
+                self.console.print(f"[dim red]{line}[/dim red]")
+
+        # Create CompletedProcess-like result
+        result = subprocess.CompletedProcess(
+            command,
+            returncode,
+            '\n'.join(output_lines),
+            None
+        )
+
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command, result.stdout)
+        return result
+
+    def write_file_sudo(self, path: str, content: str, description: Optional[str] = None):
+        """
+        Write content to a root-owned file with a single `sudo tee`.
+        
+        The content is passed on stdin, so it never goes through shell quoting.
+        
+        Args:
+            path: Destination file path
+            content: Text to write
+            description: Human-readable description for progress
+            
+        Raises:
+            PermissionError: If the file could not be written
+        """
+        if not self._check_sudo_available():
+            raise RuntimeError(
+                "sudo is required but not available or not configured. "
+                "Please ensure sudo is installed and you have the necessary permissions."
+            )
+        
+        command = ["sudo", "tee", path]
+        self.logger.log("info", "CMD: %s", _CommandLine(command))
+        
+        if description:
+            self.console.print(f"[dim]→ {description}[/dim]")
+        
+        try:
+            subprocess.run(
+                command,
+                input=content,
+                text=True,
+                stdout=subprocess.DEVNULL,
+                check=True
+            )
+        except subprocess.CalledProcessError as e:
+            raise PermissionError(f"Permission denied writing: {path}", " ".join(command)) from e
+        except FileNotFoundError as e:
+            raise CommandNotFoundError(command[0]) from e
+    
     def run(
         self,
         command: List[str],
@@ -166,14 +491,8 @@ class CommandRunner:
                     "Please ensure sudo is installed and you have the necessary permissions."
                 )
             
-            # Check if passwordless sudo is available
-            sudo_check = subprocess.run(
-                ["sudo", "-n", "true"],
-                capture_output=True,
-                timeout=2
-            )
-            
-            if sudo_check.returncode != 0:
+            # Reuses a recent passing probe, e.g. from the availability check above
+            if not self.has_cached_sudo():
                 # Sudo requires password - inform user
                 self.console.print(
                     "[yellow]⚠[/yellow] [bold]sudo password required[/bold] - "
@@ -183,176 +502,53 @@ class CommandRunner:
             
             command = ["sudo"] + command
         
-        # Add quiet flags for apt commands to reduce noise
-        # Find apt command position (could be at index 0 or 1 if sudo was prepended)
-        apt_idx = None
-        if command[0] == "apt":
-            apt_idx = 0
-        elif len(command) > 1 and command[1] == "apt":
-            apt_idx = 1
+        # Add quiet flags for apt/apt-get commands to reduce noise
+        # Find apt command position (after sudo and eatmydata, if present)
+        apt_idx = self._apt_index(command)
         
         is_apt_command = apt_idx is not None
         
         if is_apt_command:
-            # Add -qq (very quiet) flag to apt commands to suppress verbose output
-            # This suppresses "Reading package lists..." messages completely
-            if "-q" not in command and "-qq" not in command and "-qqq" not in command:
-                if "update" in command:
-                    # Insert -qq after "apt" (at apt_idx + 1) for very quiet output
-                    command.insert(apt_idx + 1, "-qq")
-                elif "install" in command:
-                    # Insert -qq after "install" for very quiet output
-                    install_idx = command.index("install")
-                    command.insert(install_idx + 1, "-qq")
-            # Suppress apt CLI warnings by redirecting status messages
-            # Add -o option to suppress the warning
-            if "-o" not in command:
-                # Find where to insert the option (after apt/apt-get)
-                option_idx = apt_idx + 1
-                # Insert after any existing flags
-                while option_idx < len(command) and command[option_idx].startswith("-"):
-                    option_idx += 1
-                command.insert(option_idx, "-o")
-                command.insert(option_idx + 1, "APT::Status-Fd=/dev/null")
+            command = self._with_apt_flags(command, apt_idx)
         
-        cmd_str = " ".join(command)
-        self.logger.log("info", f"CMD: {cmd_str}")
+        self.logger.log("info", "CMD: %s", _CommandLine(command))
         
         if description:
             self.console.print(f"[dim]→ {description}[/dim]")
         
-        # Prepare environment for apt commands to suppress warnings
-        env = os.environ.copy()
-        if is_apt_command:
-            env["DEBIAN_FRONTEND"] = "noninteractive"
-            env["APT_LISTCHANGES_FRONTEND"] = "none"
+        # Only apt commands need a modified environment
+        env = self._apt_env if is_apt_command else None
 
+        # Decided once and reused by the retry and error handling below
+        is_network, is_long_running = self._classify_command(command)
+        
         # Show progress bar for long-running commands
-        show_progress = self._is_long_running_command(command) and not capture_output
+        show_progress = self._use_progress and is_long_running and not capture_output
         progress_task = None
 
         if show_progress:
-            progress_description = description or f"Running: {command[0]}"
-            progress_task = self.progress.add_task(progress_description, total=None)
-            self.progress.start()
+            progress_task = self._start_progress(description or f"Running: {command[0]}")
 
         try:
-            # For sudo commands, handle output based on command type
-            if sudo and not capture_output:
-                # For apt commands, capture output for logging but suppress console output
-                # The -qq flag suppresses most output, we'll only show errors
-                if is_apt_command:
-                    # Use Popen with real-time reading to prevent hanging
-                    # Capture output for logging but suppress console output
-                    # Redirect stderr to stdout and filter warnings
-                    process = subprocess.Popen(
-                        command,
-                        text=True,
-                        stdin=sys.stdin,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,  # Merge stderr into stdout
-                        bufsize=0,  # Unbuffered
-                        env=env  # Use modified environment
-                    )
-                    
-                    # Read output in real-time to prevent hanging
-                    output_lines = []
-                    error_lines = []
-                    
-                    def read_output():
-                        for line in process.stdout:
-                            line = line.rstrip()
-                            if line:
-                                # Filter out apt CLI interface warnings completely
-                                if "apt does not have a stable CLI interface" in line.lower():
-                                    continue
-                                output_lines.append(line)
-                                # Log to file immediately (warnings filtered out)
-                                self.logger.log("info", line)
-                                # Check if it's an error/warning for console display
-                                line_lower = line.lower()
-                                if any(word in line_lower for word in ["error", "failed", "warning", "cannot", "unable", "e:"]):
-                                    # Skip the apt CLI warning
-                                    if "apt does not have a stable CLI interface" not in line_lower:
-                                        error_lines.append(line)
-                    
-                    # Read output in a thread to prevent blocking
-                    output_thread = threading.Thread(target=read_output, daemon=True)
-                    output_thread.start()
-                    
-                    # Wait for process to complete
-                    returncode = process.wait()
-                    output_thread.join(timeout=1)  # Wait for output reading to finish
-                    
-                    # Show errors/warnings on console
-                    if error_lines:
-                        for line in error_lines:
-                            self.console.print(f"[dim red]{line}[/dim red]")
-                    
-                    # Create CompletedProcess-like result
-                    result = subprocess.CompletedProcess(
-                        command,
-                        returncode,
-                        '\n'.join(output_lines),
-                        None
-                    )
-                    
-                    if check and returncode != 0:
-                        raise subprocess.CalledProcessError(returncode, command, result.stdout)
-                else:
-                    # For non-apt commands, show output normally
-                    if self._is_network_command(command):
-                        result = self._run_with_retry(
-                            command,
-                            check=check,
-                            text=True,
-                            stdin=sys.stdin,  # Ensure stdin is connected for password prompts
-                            env=env
-                        )
-                    else:
-                        result = subprocess.run(
-                            command,
-                            check=check,
-                            text=True,
-                            stdin=sys.stdin,  # Ensure stdin is connected for password prompts
-                            env=env
-                        )
-            elif capture_output:
-                # When capturing output, merge stderr into stdout
-                if self._is_network_command(command):
-                    result = self._run_with_retry(
-                        command,
-                        check=check,
-                        capture_output=True,
-                        env=env
-                    )
-                else:
-                    result = subprocess.run(
-                        command,
-                        check=check,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        env=env
-                    )
+            if sudo and not capture_output and is_apt_command:
+                # apt output is logged, only errors reach the console
+                result = self._run_apt(command, check, env)
             else:
-                if self._is_network_command(command):
-                    result = self._run_with_retry(
-                        command,
-                        check=check,
-                        text=True,
-                        env=env
-                    )
-                else:
-                    result = subprocess.run(
-                        command,
-                        check=check,
-                        text=True,
-                        env=env
-                    )
+                # Only network commands are retried
+                run_command = self._run_with_retry if is_network else self._run_once
+                result = run_command(
+                    command,
+                    check=check,
+                    capture_output=capture_output,
+                    # Keep stdin connected for sudo password prompts
+                    stdin=sys.stdin if sudo else None,
+                    env=env
+                )
             return result
         except subprocess.TimeoutExpired as e:
-            if self._is_network_command(command):
+            # Only failures need the command as one string
+            cmd_str = " ".join(command)
+            if is_network:
                 raise NetworkError(
                     f"Network request timed out: {cmd_str}",
                     url=next((arg for arg in command if arg.startswith(('http://', 'https://'))), None)
@@ -362,14 +558,16 @@ class CommandRunner:
                 self.logger.log("error", error_msg)
                 raise RuntimeError(error_msg) from e
         except subprocess.CalledProcessError as e:
+            cmd_str = " ".join(command)
             # Handle specific error cases
-            if self._is_network_command(command):
+            if is_network:
                 raise NetworkError(
                     f"Network request failed: {cmd_str} (exit code: {e.returncode})",
                     url=next((arg for arg in command if arg.startswith(('http://', 'https://'))), None)
                 ) from e
             elif sudo and e.returncode == 1:
-                # Likely a sudo permission issue
+                # Likely a sudo permission issue, so probe sudo again next time
+                self._sudo_passwordless_at = None
                 raise PermissionError(
                     f"Permission denied running: {cmd_str}",
                     cmd_str
@@ -380,22 +578,22 @@ class CommandRunner:
                     None
                 ) from e
             else:
-                error_msg = f"Command failed: {cmd_str}\nExit code: {e.returncode}"
+                parts = [f"Command failed: {cmd_str}", f"Exit code: {e.returncode}"]
                 if e.stdout:
-                    error_msg += f"\nOutput: {e.stdout}"
+                    parts.append(f"Output: {e.stdout}")
                 if e.stderr:
-                    error_msg += f"\nStderr: {e.stderr}"
+                    parts.append(f"Stderr: {e.stderr}")
 
-                self.logger.log("error", error_msg)
+                self.logger.log("error", "\n".join(parts))
                 raise
         except FileNotFoundError as e:
             raise CommandNotFoundError(command[0]) from e
         except Exception as e:
-            error_msg = f"Unexpected error running command: {cmd_str}\n{str(e)}"
+            error_msg = f"Unexpected error running command: {' '.join(command)}\n{str(e)}"
             self.logger.log("error", error_msg)
             raise
         finally:
             # Stop progress bar if it was started
             if show_progress and progress_task is not None:
-                self.progress.stop()
+                self._stop_progress(progress_task)
 
@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """Shell configuration utilities for automatic PATH setup."""
 
+import functools
 import os
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -10,7 +12,15 @@ from rich.console import Console
 
 console = Console()
 
+# Shells whose rc files we know how to update, with the candidate files
+# in order of preference. The first one is created if none exist
+SHELL_CONFIG_FILES = {
+    'zsh': ('.zshrc', '.zprofile', '.zshenv'),
+    'bash': ('.bashrc', '.bash_profile', '.profile'),
+}
 
+
+@functools.cache
 def detect_shell() -> str:
     """Detect the current user's shell.
 
@@ -18,23 +28,20 @@ def detect_shell() -> str:
         'bash' or 'zsh', or 'unknown' if cannot determine
     """
     # First, try to get from $SHELL environment variable
-    shell_env = os.environ.get('SHELL', '').lower()
-    if 'zsh' in shell_env:
-        return 'zsh'
-    elif 'bash' in shell_env:
-        return 'bash'
+    shell_name = os.environ.get('SHELL', '').lower().rpartition('/')[2]
+    if shell_name in SHELL_CONFIG_FILES:
+        return shell_name
 
-    # Fallback: check /etc/passwd for current user
+    # Fallback: check /etc/passwd for current user, only reached when
+    # $SHELL is unset or names another shell
     try:
         import pwd
         uid = os.getuid()
         user_info = pwd.getpwuid(uid)
-        shell_path = user_info.pw_shell.lower()
+        shell_name = user_info.pw_shell.lower().rpartition('/')[2]
 
-        if 'zsh' in shell_path:
-            return 'zsh'
-        elif 'bash' in shell_path:
-            return 'bash'
+        if shell_name in SHELL_CONFIG_FILES:
+            return shell_name
     except (ImportError, KeyError, OSError):
         pass
 
@@ -51,26 +58,56 @@ def get_shell_config_file(shell: str) -> Optional[Path]:
     Returns:
         Path to .bashrc or .zshrc, or None if not found
     """
+    candidates = SHELL_CONFIG_FILES.get(shell)
+    if candidates is None:
+        return None
+
     home = Path.home()
 
-    if shell == 'zsh':
-        # Check for .zshrc first, then .zprofile, then .zshenv
-        for config_file in ['.zshrc', '.zprofile', '.zshenv']:
-            config_path = home / config_file
-            if config_path.exists():
-                return config_path
-        # If none exist, use .zshrc
-        return home / '.zshrc'
-    elif shell == 'bash':
-        # Check for .bashrc first, then .bash_profile, then .profile
-        for config_file in ['.bashrc', '.bash_profile', '.profile']:
-            config_path = home / config_file
-            if config_path.exists():
-                return config_path
-        # If none exist, use .bashrc
-        return home / '.bashrc'
-
-    return None
+    # One directory listing instead of a stat per candidate
+    try:
+        with os.scandir(home) as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        present = set()
+
+    for config_file in candidates:
+        if config_file in present:
+            return home / config_file
+    # If none exist, use .zshrc or .bashrc
+    return home / candidates[0]
+
+
+def detect_shell_config() -> tuple[str, Optional[Path]]:
+    """Detect the current user's shell together with its config file.
+
+    Returns:
+        The shell name and its config file, see get_shell_config_file()
+    """
+    shell = detect_shell()
+    return shell, get_shell_config_file(shell)
+
+
+# A PATH assignment, e.g. export PATH="$HOME/bin:$PATH", capturing the value
+# without quotes. It may follow a guard like [ -d dir ] && and may be followed
+# by ; or a trailing comment. Commented out lines don't match
+_PATH_ASSIGNMENT_RE = re.compile(
+    rb'(?:^|&&|\|\||;)[ \t]*(?:export[ \t]+)?PATH[ \t]*=[ \t]*'
+    rb'["\']?([^"\'\s;#&|]+)["\']?(?=[ \t\r]*(?:$|[;#&|]))',
+    re.MULTILINE
+)
+
+
+def _has_path_entry(content: bytes, path_to_add: str) -> bool:
+    """Check if any PATH assignment in an rc file already lists a directory.
+
+    Works on the raw file bytes, the tokens involved are all ASCII.
+    """
+    entry = path_to_add.encode()
+    return any(
+        entry in value.split(b':')
+        for value in _PATH_ASSIGNMENT_RE.findall(content)
+    )
 
 
 def add_to_path(config_file: Path, path_to_add: str) -> bool:
@@ -84,43 +121,28 @@ def add_to_path(config_file: Path, path_to_add: str) -> bool:
         True if path was added, False if already present or error occurred
     """
     try:
-        # Read current content
-        if config_file.exists():
-            content = config_file.read_text()
-        else:
-            content = ""
-
-        # Check if PATH export already exists
+        # Read current content as bytes, no need to decode it for the
+        # check below. A missing file is simply empty
+        try:
+            content = config_file.read_bytes()
+        except FileNotFoundError:
+            content = b""
+
+        # Check if PATH export already exists, however it is quoted or spaced
         path_export = f'export PATH="{path_to_add}:$PATH"'
-        if path_export in content:
+        if _has_path_entry(content, path_to_add):
             console.print(f"[dim]→ PATH entry already exists in {config_file.name}[/dim]")
             return False
 
-        # Also check for alternative formats
-        alt_formats = [
-            f'export PATH="{path_to_add}:\\$PATH"',
-            f'export PATH={path_to_add}:$PATH',
-            f'export PATH={path_to_add}:\\$PATH',
-            f'PATH="{path_to_add}:$PATH"',
-            f'PATH={path_to_add}:$PATH'
-        ]
-
-        for alt_format in alt_formats:
-            if alt_format in content:
-                console.print(f"[dim]→ PATH entry already exists in {config_file.name}[/dim]")
-                return False
-
         # Add the PATH export at the end of the file
-        if content and not content.endswith('\n'):
-            content += '\n'
-
-        content += f'\n# Added by rig installer\n{path_export}\n'
-
-        # Create parent directories if needed
-        config_file.parent.mkdir(parents=True, exist_ok=True)
+        addition = f'\n# Added by rig installer\n{path_export}\n'
+        if content and not content.endswith(b'\n'):
+            addition = '\n' + addition
 
-        # Write back to file
-        config_file.write_text(content)
+        # Append only the new lines instead of rewriting the whole file.
+        # The rc files live directly in $HOME, so the parent always exists
+        with config_file.open('ab') as f:
+            f.write(addition.encode())
 
         console.print(f"[green]✓[/green] Added PATH entry to {config_file.name}")
         return True
@@ -142,12 +164,10 @@ def update_shell_config(install_dir: str) -> bool:
     try:
         console.print("[blue]ℹ[/blue] Configuring shell...")
 
-        # Detect shell
-        shell = detect_shell()
+        # Detect shell and its config file
+        shell, config_file = detect_shell_config()
         console.print(f"[dim]→ Detected shell: {shell}[/dim]")
 
-        # Get config file
-        config_file = get_shell_config_file(shell)
         if not config_file:
             console.print(f"[red]✖[/red] Could not determine config file for shell: {shell}")
             return False
@@ -164,6 +184,8 @@ def update_shell_config(install_dir: str) -> bool:
 
         return success
 
-    except Exception as e:
+    except (OSError, RuntimeError) as e:
+        # RuntimeError is raised by Path.home() when there is no home directory.
+        # Anything else is a bug and should propagate
         console.print(f"[red]✖[/red] Failed to configure shell: {e}")
         return False
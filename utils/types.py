@@ -2,22 +2,78 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """Type definitions for the setup tool."""
 
-from dataclasses import dataclass
-from typing import Optional
+from __future__ import annotations
 
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable, Literal, Optional
 
-@dataclass
+if TYPE_CHECKING:
+    from .base import BaseInstaller
+
+
+@dataclass(slots=True, frozen=True)
 class InstallerResult:
-    """Result of an installation operation."""
+    """Result of an installation operation.
+
+    Results are created once per tool and never changed afterwards, so they
+    are frozen and use slots instead of a per-instance ``__dict__``.
+    """
     success: bool
     message: str
     error: Optional[str] = None
+    # Set by installers that found nothing to do
+    skipped: bool = False
+    # "success", "skipped" or "failed", derived from success and skipped
+    status: Literal["success", "skipped", "failed"] = field(init=False, compare=False)
+    # Error shortened for the summary table, empty when there is none
+    display_error: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if not self.success:
+            status = "failed"
+        else:
+            status = "skipped" if self.skipped else "success"
+        
+        if self.error and len(self.error) > 60:
+            display_error = f"{self.error[:57]}..."
+        else:
+            display_error = self.error or ""
+        
+        # Frozen, so the derived fields are set past the generated __setattr__
+        object.__setattr__(self, "status", status)
+        object.__setattr__(self, "display_error", display_error)
 
 
 @dataclass
 class InstallOption:
-    """Represents an installation option."""
+    """Represents an installation option.
+
+    The installer is built by ``factory`` on first access, so installer
+    modules are only imported for options that get used. Unlike the other
+    types it keeps a ``__dict__``, which cached_property and the
+    ``installed`` flag set after the pre-check both need.
+    """
     name: str
-    installer: "BaseInstaller"
+    factory: Callable[[], BaseInstaller]
     description: str
+    # Result of the is_installed() check made before prompting
+    installed: Optional[bool] = None
+    # Registry entry the option was built from, used by the result cache
+    spec: Optional[InstallerSpec] = None
+    
+    @cached_property
+    def installer(self) -> BaseInstaller:
+        return self.factory()
+
 
+@dataclass(slots=True, frozen=True)
+class InstallerSpec:
+    """Static metadata for an installer, readable without importing it."""
+    key: str
+    title: str
+    description: str
+    module: str
+    class_name: str
+    check_binary: tuple[str, ...] = ()
+    apt_packages: tuple[str, ...] = ()